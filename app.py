@@ -28,6 +28,7 @@ class MovieRecommendationApp:
         # Initialize data handlers and managers
         self.data_handler = DataHandler()
         self.user_manager = UserManager()
+        self.user_manager.on_save_error = self._on_save_error
         self.recommender = MovieRecommender(self.data_handler)
         
         # Create a container frame for all screens
@@ -130,6 +131,19 @@ class MovieRecommendationApp:
         screen.update_screen()  # Refresh the screen data
         screen.pack(fill=tk.BOTH, expand=True)
     
+    def _on_save_error(self, file_path, error):
+        """Handle a failed background save reported from the user manager's I/O thread"""
+        # Tk may only be used from the main loop
+        self.root.after(0, self._show_save_error, file_path, error)
+    
+    def _show_save_error(self, file_path, error):
+        """Tell the user a save failed and redraw the visible screen from disk"""
+        self.user_manager.forget_unsaved(file_path)
+        show_error("Save Failed", f"Your changes could not be saved:\n{error}")
+        for screen in self.screens.values():
+            if screen.winfo_ismapped():
+                screen.update_screen()
+    
     def show_movie_detail(self, movie):
         """Show the movie detail screen for a specific movie"""
         if movie and 'id' in movie:
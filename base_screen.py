@@ -2,12 +2,15 @@
 Base Screen module providing common functionality for all screens
 """
 import tkinter as tk
-from config import BG_COLOR, PRIMARY_COLOR, SECONDARY_COLOR
+from config import BG_COLOR, PRIMARY_COLOR, SECONDARY_COLOR, TEXT_COLOR, TEXT_COLOR_LIGHT, TEXT_COLOR_INVERSE
 from ui_components import StatusBar, UserPanel
 
 class BaseScreen(tk.Frame):
     """Base class for all screens in the application"""
     
+    # Sort choices offered by list screens, the first being the default
+    SORT_OPTIONS = ("Date Added", "Title", "Rating")
+    
     def __init__(self, parent, data_handler, user_manager=None, **kwargs):
         """Initialize a base screen"""
         super().__init__(parent, bg=BG_COLOR)
@@ -101,6 +104,78 @@ class BaseScreen(tk.Frame):
         self.status_bar = StatusBar(self)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
     
+    def _reset_root_frame(self):
+        """Replace the screen's root content frame with a fresh, empty one"""
+        # Destroying the single root frame lets Tk tear down the whole subtree at once
+        if getattr(self, '_root_frame', None):
+            self._root_frame.destroy()
+        self._root_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
+        self._root_frame.pack(fill=tk.BOTH, expand=True)
+        return self._root_frame
+    
+    def _build_sortable_list_header(self, parent, title, items, badge_bg, on_sort_cb):
+        """Build a list header with a title, item count badge and sort options"""
+        header_frame = tk.Frame(parent, bg=BG_COLOR)
+        
+        header_label = tk.Label(
+            header_frame,
+            text=title,
+            font=("Helvetica", 20, "bold"),
+            bg=BG_COLOR,
+            fg=TEXT_COLOR,
+            anchor='w'
+        )
+        header_label.pack(side=tk.LEFT)
+        
+        # Add count badge
+        count_badge = tk.Label(
+            header_frame,
+            text=str(len(items)),
+            font=("Helvetica", 12, "bold"),
+            bg=badge_bg,
+            fg=TEXT_COLOR_INVERSE,
+            padx=10,
+            pady=2,
+            borderwidth=0
+        )
+        count_badge.pack(side=tk.LEFT, padx=10)
+        
+        # Add sorting options
+        sort_frame = tk.Frame(header_frame, bg=BG_COLOR)
+        sort_frame.pack(side=tk.RIGHT)
+        
+        sort_label = tk.Label(
+            sort_frame,
+            text="Sort by:",
+            font=("Helvetica", 10),
+            bg=BG_COLOR,
+            fg=TEXT_COLOR_LIGHT
+        )
+        sort_label.pack(side=tk.LEFT, padx=(0, 5))
+        
+        # Sort buttons
+        self.active_sort = tk.StringVar(value=self.SORT_OPTIONS[0])
+        
+        for option in self.SORT_OPTIONS:
+            sort_button = tk.Radiobutton(
+                sort_frame,
+                text=option,
+                variable=self.active_sort,
+                value=option,
+                font=("Helvetica", 10),
+                bg=BG_COLOR,
+                fg=TEXT_COLOR,
+                selectcolor=BG_COLOR,
+                command=on_sort_cb,
+                indicatoron=False,
+                bd=0,
+                padx=8,
+                pady=2
+            )
+            sort_button.pack(side=tk.LEFT, padx=2)
+        
+        return header_frame, count_badge
+    
     def set_title(self, title):
         """Set the screen title"""
         self.title_label.config(text=title)
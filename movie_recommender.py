@@ -7,6 +7,7 @@ from data_handler import DataHandler
 from collections import Counter
 from sklearn.metrics.pairwise import cosine_similarity
 from scipy.sparse import csr_matrix
+from utils import convert_to_year
 
 class MovieRecommender:
     def __init__(self, data_handler):
@@ -99,6 +100,19 @@ class MovieRecommender:
         """Get recommendations based on trending status"""
         return self.data_handler.get_trending_movies(limit)
     
+    def _fill_release_years(self, movies):
+        """Return movie records with release_year derived from release_date where it is missing"""
+        filled = []
+        for movie in movies:
+            year = movie.get('release_year')
+            # Missing, blank or NaN years are parsed once here rather than by every screen
+            if not year or year != year:
+                date = movie.get('release_date')
+                year = convert_to_year(str(date)) if date is not None else None
+                movie = dict(movie, release_year=year or '')
+            filled.append(movie)
+        return filled
+    
     def get_similar_movies(self, movie_id, limit=10):
         """Get recommendations based on similarity to a specific movie"""
         # Try the improved content-based approach first
@@ -106,8 +120,8 @@ class MovieRecommender:
         
         # Fall back to the basic approach if needed
         if improved_recommendations:
-            return improved_recommendations
-        return self.data_handler.get_movie_recommendations(movie_id, limit)
+            return self._fill_release_years(improved_recommendations)
+        return self._fill_release_years(self.data_handler.get_movie_recommendations(movie_id, limit))
     
     def get_similar_movies_improved(self, movie_id, limit=20):
         """
@@ -244,12 +258,12 @@ class MovieRecommender:
     def get_recommendations_for_watchlist(self, watchlist, limit=10):
         """Get recommendations based on movies in user's watchlist"""
         if not watchlist:
-            return self.get_popular_recommendations(limit)
+            return self._fill_release_years(self.get_popular_recommendations(limit))
         
         # Try using the hybrid approach first
         hybrid_recommendations = self.get_hybrid_recommendations(watchlist, limit)
         if hybrid_recommendations:
-            return hybrid_recommendations
+            return self._fill_release_years(hybrid_recommendations)
             
         # Fallback to the original method
         # Get similar movies for each movie in the watchlist
@@ -261,7 +275,7 @@ class MovieRecommender:
         
         # If we have no similar movies, return popular recommendations
         if not all_similar:
-            return self.get_popular_recommendations(limit)
+            return self._fill_release_years(self.get_popular_recommendations(limit))
         
         # Count frequency of each movie in the recommendations
         movie_counts = {}
@@ -284,7 +298,7 @@ class MovieRecommender:
                 if movie.get('id') not in existing_ids and len(top_movies) < limit:
                     top_movies.append(movie)
         
-        return top_movies
+        return self._fill_release_years(top_movies)
         
     def get_hybrid_recommendations(self, watchlist, limit=10):
         """
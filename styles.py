@@ -135,6 +135,18 @@ LABEL_STYLE = {
     "pady": PADDING_SMALL
 }
 
+LABEL_MUTED = {
+    "bg": BG_COLOR,
+    "fg": TEXT_COLOR_LIGHT,
+    "font": (FONT_FAMILY, FONT_SIZE_SMALL)
+}
+
+LABEL_TITLE = {
+    "bg": BG_COLOR,
+    "fg": TEXT_COLOR,
+    "font": (FONT_FAMILY, FONT_SIZE_MEDIUM, "bold")
+}
+
 BUTTON_STYLE = {
     "bg": SECONDARY_COLOR,
     "fg": TEXT_COLOR_INVERSE,
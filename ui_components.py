@@ -89,6 +89,9 @@ class ScrollableFrame(tk.Frame):
 class HoverButton(tk.Button):
     """A button that changes appearance when hovered"""
     
+    # Hover handlers are bound once to this bindtag rather than per button
+    BINDTAG = "HoverButton"
+    
     def __init__(self, master=None, hover_bg=None, hover_fg=None, **kwargs):
         super().__init__(master, **kwargs)
         self.default_bg = kwargs.get('bg', self['bg'])
@@ -96,8 +99,14 @@ class HoverButton(tk.Button):
         self.hover_bg = hover_bg if hover_bg else SECONDARY_COLOR
         self.hover_fg = hover_fg if hover_fg else TEXT_COLOR_INVERSE
         
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
+        # Class bindings live in the Tcl interpreter, so bind once per Tk root
+        if not self.bind_class(self.BINDTAG):
+            self.bind_class(self.BINDTAG, "<Enter>", lambda event: event.widget._on_enter(event))
+            self.bind_class(self.BINDTAG, "<Leave>", lambda event: event.widget._on_leave(event))
+        
+        # Run the shared hover bindings right after the standard Button ones
+        tags = self.bindtags()
+        self.bindtags(tags[:2] + (self.BINDTAG,) + tags[2:])
     
     def _on_enter(self, event):
         """Change colors when mouse enters"""
@@ -865,7 +874,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_login_click
+            command=self.on_login
         )
         
         self.register_button = LabelButton(
@@ -878,7 +887,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_register_click
+            command=self.on_register
         )
         
         # Action buttons for logged-in users
@@ -892,7 +901,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_watchlist_click
+            command=self.on_watchlist
         )
         
         self.bookmarks_button = LabelButton(
@@ -905,7 +914,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_bookmarks_click
+            command=self.on_bookmarks
         )
         
         self.profile_button = LabelButton(
@@ -918,7 +927,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_profile_click
+            command=self.on_profile
         )
         
         self.logout_button = LabelButton(
@@ -931,7 +940,7 @@ class UserPanel(tk.Frame):
             hover_fg=TEXT_COLOR_INVERSE,
             padx=PADDING_MEDIUM,
             pady=PADDING_SMALL,
-            command=self._on_logout_click
+            command=self.on_logout
         )
         
         # Initialize the display based on user login status
@@ -986,33 +995,3 @@ class UserPanel(tk.Frame):
                 fg=TEXT_COLOR_INVERSE,
                 padx=PADDING_SMALL
             ).pack(side=tk.LEFT)
-    
-    def _on_login_click(self):
-        """Handle login button click"""
-        if self.on_login:
-            self.on_login()
-    
-    def _on_register_click(self):
-        """Handle register button click"""
-        if self.on_register:
-            self.on_register()
-    
-    def _on_logout_click(self):
-        """Handle logout button click"""
-        if self.on_logout:
-            self.on_logout()
-    
-    def _on_profile_click(self):
-        """Handle profile button click"""
-        if self.on_profile:
-            self.on_profile()
-    
-    def _on_watchlist_click(self):
-        """Handle watchlist button click"""
-        if self.on_watchlist:
-            self.on_watchlist()
-    
-    def _on_bookmarks_click(self):
-        """Handle bookmarks button click"""
-        if self.on_bookmarks:
-            self.on_bookmarks()
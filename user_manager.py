@@ -5,7 +5,10 @@ import os
 import json
 import hashlib
 import time
+import copy
+import functools
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 from config import USER_DATA_PATH, PASSWORD_MIN_LENGTH, USERNAME_MIN_LENGTH
 from utils import create_directory_if_not_exists, save_json_data, load_json_data
@@ -14,6 +17,16 @@ class UserManager:
     def __init__(self):
         self.users_file = os.path.join(USER_DATA_PATH, "users.json")
         self.current_user = None
+        # Bumped on every bookmark change so screens can tell when cached bookmarks are stale
+        self.bookmarks_version = 0
+        # Saves run on one background thread, so writes to a file stay in order
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Watchlist and bookmark files already read, keyed by path, as [mtime, data]
+        self._movie_lists = {}
+        # Latest queued save per file
+        self._pending_saves = {}
+        # Called from the I/O thread as on_save_error(file_path, error) when a save fails
+        self.on_save_error = None
         self._load_users()
     
     def _load_users(self):
@@ -23,7 +36,84 @@ class UserManager:
     
     def _save_users(self):
         """Save user data to JSON file"""
-        save_json_data(self.users, self.users_file)
+        # User records are never edited in place (see _edit_user), so copying the list is enough
+        self._save_async(dict(self.users, users=list(self.users["users"])), self.users_file)
+    
+    def _edit_user(self, user):
+        """Swap a copy of a user record into the user list and return it for editing"""
+        # Saves still queued keep the old record, so the writer never sees a half-made edit
+        users = self.users["users"]
+        edited = copy.deepcopy(user)
+        for index, u in enumerate(users):
+            if u is user:
+                users[index] = edited
+                break
+        if self.current_user is user:
+            self.current_user = edited
+        return edited
+    
+    def _save_async(self, data, file_path):
+        """Queue a JSON save on the I/O thread so the UI never waits on the disk"""
+        future = self._io_pool.submit(save_json_data, data, file_path)
+        future.add_done_callback(functools.partial(self._on_saved, file_path))
+        return future
+    
+    def _on_saved(self, file_path, future):
+        """Report a background save that failed"""
+        error = future.exception()
+        if error is None:
+            return
+        
+        print(f"Error saving user data: {error}")
+        if self.on_save_error:
+            self.on_save_error(file_path, error)
+        else:
+            self.forget_unsaved(file_path)
+    
+    def forget_unsaved(self, file_path):
+        """Drop in-memory changes to a file whose save failed, so it is read back from disk"""
+        self._movie_lists.pop(file_path, None)
+        if os.path.basename(file_path) == "bookmarks.json":
+            self.bookmarks_version += 1
+    
+    @staticmethod
+    def _file_mtime(file_path):
+        """Return a file's modification time, or None if it can't be read"""
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _load_movie_list(self, file_path):
+        """Get the data stored in a watchlist or bookmarks file, re-reading it only when it changed"""
+        entry = self._movie_lists.get(file_path)
+        if entry is not None:
+            # Until our own queued writes land, memory is newer than the file
+            pending = self._pending_saves.get(file_path)
+            if pending is not None and not pending.done():
+                return entry[1]
+            if entry[0] == self._file_mtime(file_path):
+                return entry[1]
+        
+        # Not read yet, or edited outside the app
+        mtime = self._file_mtime(file_path)
+        data = load_json_data(file_path, default={"movies": []})
+        self._movie_lists[file_path] = [mtime, data]
+        return data
+    
+    def _save_movie_list(self, data, file_path):
+        """Save a watchlist or bookmarks file in the background"""
+        entry = self._movie_lists.setdefault(file_path, [None, data])
+        
+        def _record_mtime(future):
+            # Runs on the I/O thread straight after the write, so the file is ours
+            if future.exception() is None:
+                entry[0] = self._file_mtime(file_path)
+        
+        # Snapshot the list so later edits can't race the writer
+        future = self._save_async(dict(data, movies=list(data["movies"])), file_path)
+        future.add_done_callback(_record_mtime)
+        self._pending_saves[file_path] = future
     
     def _hash_password(self, password):
         """Hash a password using SHA-256"""
@@ -75,8 +165,8 @@ class UserManager:
         watchlist_file = os.path.join(user_dir, "watchlist.json")
         bookmarks_file = os.path.join(user_dir, "bookmarks.json")
         
-        save_json_data({"movies": []}, watchlist_file)
-        save_json_data({"movies": []}, bookmarks_file)
+        self._save_movie_list({"movies": []}, watchlist_file)
+        self._save_movie_list({"movies": []}, bookmarks_file)
         
         return True, "Registration successful"
     
@@ -100,6 +190,7 @@ class UserManager:
             return False, "Invalid username or password"
         
         # Update last login time
+        user = self._edit_user(user)
         user["last_login"] = datetime.now().isoformat()
         self._save_users()
         
@@ -123,7 +214,8 @@ class UserManager:
             return False, "No user logged in"
         
         # Update profile fields
-        self.current_user["profile"].update(profile_data)
+        user = self._edit_user(self.current_user)
+        user["profile"].update(profile_data)
         
         # Save changes
         self._save_users()
@@ -137,9 +229,10 @@ class UserManager:
         
         user_id = self.current_user["id"]
         watchlist_file = os.path.join(USER_DATA_PATH, user_id, "watchlist.json")
-        watchlist_data = load_json_data(watchlist_file, default={"movies": []})
+        watchlist_data = self._load_movie_list(watchlist_file)
         
-        return watchlist_data["movies"]
+        # Hand out copies so screens can annotate entries without them being saved
+        return [dict(m) for m in watchlist_data["movies"]]
     
     def add_to_watchlist(self, movie):
         """Add a movie to the current user's watchlist"""
@@ -148,7 +241,7 @@ class UserManager:
         
         user_id = self.current_user["id"]
         watchlist_file = os.path.join(USER_DATA_PATH, user_id, "watchlist.json")
-        watchlist_data = load_json_data(watchlist_file, default={"movies": []})
+        watchlist_data = self._load_movie_list(watchlist_file)
         
         # Check if movie is already in watchlist
         movie_id = movie.get("id")
@@ -166,7 +259,7 @@ class UserManager:
         }
         
         watchlist_data["movies"].append(watchlist_entry)
-        save_json_data(watchlist_data, watchlist_file)
+        self._save_movie_list(watchlist_data, watchlist_file)
         
         return True, "Movie added to watchlist"
     
@@ -177,7 +270,7 @@ class UserManager:
         
         user_id = self.current_user["id"]
         watchlist_file = os.path.join(USER_DATA_PATH, user_id, "watchlist.json")
-        watchlist_data = load_json_data(watchlist_file, default={"movies": []})
+        watchlist_data = self._load_movie_list(watchlist_file)
         
         # Filter out the movie to remove
         original_count = len(watchlist_data["movies"])
@@ -186,7 +279,7 @@ class UserManager:
         if len(watchlist_data["movies"]) == original_count:
             return False, "Movie not found in watchlist"
         
-        save_json_data(watchlist_data, watchlist_file)
+        self._save_movie_list(watchlist_data, watchlist_file)
         
         return True, "Movie removed from watchlist"
     
@@ -197,9 +290,10 @@ class UserManager:
         
         user_id = self.current_user["id"]
         bookmarks_file = os.path.join(USER_DATA_PATH, user_id, "bookmarks.json")
-        bookmarks_data = load_json_data(bookmarks_file, default={"movies": []})
+        bookmarks_data = self._load_movie_list(bookmarks_file)
         
-        return bookmarks_data["movies"]
+        # Hand out copies so screens can annotate entries without them being saved
+        return [dict(m) for m in bookmarks_data["movies"]]
     
     def add_bookmark(self, movie):
         """Add a movie to the current user's bookmarks"""
@@ -208,7 +302,7 @@ class UserManager:
         
         user_id = self.current_user["id"]
         bookmarks_file = os.path.join(USER_DATA_PATH, user_id, "bookmarks.json")
-        bookmarks_data = load_json_data(bookmarks_file, default={"movies": []})
+        bookmarks_data = self._load_movie_list(bookmarks_file)
         
         # Check if movie is already bookmarked
         movie_id = movie.get("id")
@@ -226,7 +320,8 @@ class UserManager:
         }
         
         bookmarks_data["movies"].append(bookmark_entry)
-        save_json_data(bookmarks_data, bookmarks_file)
+        self._save_movie_list(bookmarks_data, bookmarks_file)
+        self.bookmarks_version += 1
         
         return True, "Movie bookmarked successfully"
     
@@ -237,7 +332,7 @@ class UserManager:
         
         user_id = self.current_user["id"]
         bookmarks_file = os.path.join(USER_DATA_PATH, user_id, "bookmarks.json")
-        bookmarks_data = load_json_data(bookmarks_file, default={"movies": []})
+        bookmarks_data = self._load_movie_list(bookmarks_file)
         
         # Filter out the movie to remove
         original_count = len(bookmarks_data["movies"])
@@ -246,6 +341,7 @@ class UserManager:
         if len(bookmarks_data["movies"]) == original_count:
             return False, "Movie not found in bookmarks"
         
-        save_json_data(bookmarks_data, bookmarks_file)
+        self._save_movie_list(bookmarks_data, bookmarks_file)
+        self.bookmarks_version += 1
         
         return True, "Bookmark removed successfully"
@@ -4,7 +4,12 @@ User-related screens for the Movie Recommendation System
 import tkinter as tk
 from tkinter import ttk
 import re
-from datetime import datetime
+import random
+import functools
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from statistics import fmean
 
 from config import (
     BG_COLOR, PRIMARY_COLOR, SECONDARY_COLOR, ACCENT_COLOR, 
@@ -12,14 +17,236 @@ from config import (
 )
 from screens.base_screen import BaseScreen
 from ui_components import (
-    ScrollableFrame, MovieCard, HoverButton, LabelButton
+    ScrollableFrame, HoverButton, LabelButton
+)
+from utils import (
+    show_error, show_confirmation, show_info, create_circular_frame, truncate_text,
+    destroy_children
 )
-from utils import show_error, show_confirmation, show_info, create_circular_frame, truncate_text
 from assets.styles import (
     PADDING_SMALL, PADDING_MEDIUM, PADDING_LARGE,
-    BUTTON_STYLE, ACCENT_BUTTON_STYLE, ENTRY_STYLE
+    BUTTON_STYLE, ACCENT_BUTTON_STYLE, ENTRY_STYLE, LABEL_MUTED, LABEL_TITLE
+)
+
+# Simple email shape check used by the registration form
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Static registration messages
+_USERNAME_LENGTH_MSG = f"Username must be at least {USERNAME_MIN_LENGTH} characters"
+_PASSWORD_LENGTH_MSG = f"Password must be at least {PASSWORD_MIN_LENGTH} characters"
+_REQUIREMENTS_TEXT = f"{_USERNAME_LENGTH_MSG}\n{_PASSWORD_LENGTH_MSG}"
+
+# Fonts shared by the user forms
+_LABEL_FONT = ("Helvetica", 12)
+_HEADER_FONT = ("Helvetica", 18, "bold")
+
+# Widget options shared by the user forms
+_ENTRY_KW_W30 = {**ENTRY_STYLE, 'width': 30}
+_CANCEL_BTN_KW = dict(
+    bg=TEXT_COLOR_LIGHT,
+    fg="white",
+    activebackground=TEXT_COLOR,
+    activeforeground="white",
+    font=_LABEL_FONT,
+    padx=15,
+    pady=5,
+    bd=0
+)
+
+# Emoji shown next to a movie for its first recognised genre
+GENRE_ICONS = {
+    'Action': '💥', 'Adventure': '🌄', 'Animation': '🧸',
+    'Comedy': '😄', 'Crime': '🕵️', 'Documentary': '📹',
+    'Drama': '🎭', 'Family': '👨‍👩‍👧‍👦', 'Fantasy': '🧙',
+    'History': '📜', 'Horror': '👻', 'Music': '🎵',
+    'Mystery': '🔍', 'Romance': '❤️', 'Science Fiction': '🚀',
+    'TV Movie': '📺', 'Thriller': '😱', 'War': '⚔️',
+    'Western': '🤠'
+}
+
+# "View Details" button with the standard button style already applied
+_ViewDetailsButton = functools.partial(HoverButton, text="View Details", **BUTTON_STYLE)
+
+# Leading YYYY-MM-DD of the stored added_at timestamps
+_ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
 )
 
+# Sort option -> (index into the per-movie sort key tuple, descending)
+_WATCHLIST_SORT_COLUMNS = {
+    "Date Added": (0, True),
+    "Title": (1, False),
+    "Rating": (2, True)
+}
+
+# How often to check whether background recommendations are ready (ms)
+_REC_POLL_MS = 50
+
+# Recommendation results kept for recently seen watchlists
+_REC_CACHE_SIZE = 8
+
+# Fonts for the watchlist row labels
+_ROW_ICON_FONT = ("Helvetica", 16)
+_ROW_TITLE_FONT = ("Helvetica", 14, "bold")
+_ROW_META_FONT = ("Helvetica", 10)
+
+# Watchlist row backgrounds for even and odd positions
+_ROW_BACKGROUNDS = (BG_COLOR, "#f0f0f5")
+
+# Gap between the year, rating and date in a watchlist row's details line
+_DETAILS_SEPARATOR = "    "
+
+# Extra watchlist rows rendered above and below the viewport
+_WATCHLIST_OVERSCAN = 3
+
+# Sort option -> (precomputed sort key stored on each bookmark, descending)
+_BOOKMARK_SORT_KEYS = {
+    "Date Added": ('_added_key', True),
+    "Title": ('_title_lc', False),
+    "Rating": ('_rating_f', True)
+}
+
+# Extra rows of bookmark cards rendered above and below the viewport
+_BOOKMARKS_OVERSCAN = 1
+
+# Off-screen bookmark cards kept bound to their movie before being recycled
+_CARD_CACHE_SIZE = 64
+
+# Delay used to coalesce bursts of bookmark screen updates
+_UPDATE_DEBOUNCE_MS = 50
+
+# Bookmark collections larger than this can be shown as a single Treeview list
+_LIST_VIEW_THRESHOLD = 50
+_LIST_VIEW_ROWS = 20
+
+def _add_field(parent, text, row, show=None, lw=10):
+    """Add a labelled entry row to a grid-managed form and return the entry"""
+    label = tk.Label(
+        parent,
+        text=text,
+        font=_LABEL_FONT,
+        bg=BG_COLOR,
+        fg=TEXT_COLOR,
+        width=lw,
+        anchor='w'
+    )
+    label.grid(row=row, column=0, sticky='w', pady=PADDING_SMALL)
+    
+    entry = tk.Entry(
+        parent,
+        show=show,
+        **_ENTRY_KW_W30
+    )
+    entry.grid(row=row, column=1, sticky='w', padx=PADDING_SMALL, pady=PADDING_SMALL)
+    return entry
+
+def _make_form_scaffold(parent, title):
+    """Create a centered form frame with a header and return both"""
+    form_frame = tk.Frame(
+        parent,
+        bg=BG_COLOR,
+        padx=PADDING_LARGE,
+        pady=PADDING_LARGE
+    )
+    form_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+    
+    header_label = tk.Label(
+        form_frame,
+        text=title,
+        font=_HEADER_FONT,
+        bg=BG_COLOR,
+        fg=TEXT_COLOR,
+        pady=PADDING_MEDIUM
+    )
+    header_label.pack(fill=tk.X)
+    return form_frame, header_label
+
+def _make_cancel(parent, cmd):
+    """Create the grey Cancel button used by the user forms"""
+    return HoverButton(parent, text="Cancel", **_CANCEL_BTN_KW, command=cmd)
+
+def _set_entry_text(entry, text):
+    """Replace the contents of an entry with the given text"""
+    entry.delete(0, tk.END)
+    if text:
+        entry.insert(0, text)
+
+def _fast_strip(text):
+    """Strip surrounding whitespace, skipping the strip when there is none"""
+    if text and (text[0].isspace() or text[-1].isspace()):
+        return text.strip()
+    return text
+
+def _split_csv(text):
+    """Split a comma-separated string into a list of non-empty, stripped values"""
+    return [t for t in (x.strip() for x in text.split(',')) if t]
+
+def _store_sort_keys(m):
+    """Store a movie's sort keys on it"""
+    # Unparsable ratings sort as 0 but are left out of rating stats
+    rating = m.get('vote_average')
+    try:
+        rating = float(rating) if rating is not None else None
+    except (TypeError, ValueError):
+        rating = None
+    m['_title_lc'] = m.get('title', '').lower()
+    m['_rating_stat'] = rating
+    m['_rating_f'] = rating or 0.0
+    # ISO timestamps already sort chronologically as strings
+    m['_added_key'] = m.get('added_at', '')
+
+def _ensure_sort_keys(movies):
+    """Store each movie's sort keys on it the first time it is sorted"""
+    for m in movies:
+        if '_title_lc' not in m:
+            _store_sort_keys(m)
+
+def _movie_genres(movie):
+    """Return a movie's genres as a list, parsed once and cached on the movie"""
+    genres = movie.get('_genres_list')
+    if genres is None:
+        genres = movie.get('genres', []) or []
+        if isinstance(genres, str):
+            genres = [g.strip() for g in genres.split(',')]
+        genres = movie['_genres_list'] = [g for g in genres if g]
+    return genres
+
+def _scan_bookmarks(bookmarks):
+    """Prepare sort keys and gather genre counts and ratings in one pass"""
+    genres_count = Counter()
+    ratings = []
+    for m in bookmarks:
+        if '_title_lc' not in m:
+            _store_sort_keys(m)
+        genres_count.update(_movie_genres(m))
+        if m['_rating_stat'] is not None:
+            ratings.append(m['_rating_stat'])
+    return genres_count, ratings
+
+def _visible_span(scroll_frame, container, extent, count, overscan):
+    """Return the [start, end) range of fixed-height rows of container visible in scroll_frame"""
+    canvas = scroll_frame.canvas
+    viewport = max(canvas.winfo_height(), canvas.winfo_reqheight())
+    view_top = canvas.canvasy(0) - container.winfo_y()
+    start = max(0, int(view_top // extent) - overscan)
+    end = min(count, int((view_top + viewport) // extent) + 1 + overscan)
+    return min(start, end), end
+
+@functools.lru_cache(maxsize=512)
+def _format_added_date(added_date):
+    """Format a stored ISO timestamp as a readable date"""
+    m = _ISO_DATE_RE.match(added_date)
+    if m and 1 <= int(m[2]) <= 12:
+        return f"{_MONTHS[int(m[2]) - 1]} {m[3]}, {m[1]}"
+    # Just take the date part as fallback
+    return added_date.partition('T')[0]
+
+def _added_date_text(added_date):
+    """Format a stored ISO timestamp as an 'Added: ...' caption"""
+    return f"Added: {_format_added_date(added_date)}"
+
 class LoginScreen(BaseScreen):
     """Screen for user login"""
     
@@ -38,78 +265,25 @@ class LoginScreen(BaseScreen):
     
     def _create_ui(self):
         """Create the login screen UI"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create a centered login form
-        form_frame = tk.Frame(
-            self.content_frame,
-            bg=BG_COLOR,
-            padx=PADDING_LARGE,
-            pady=PADDING_LARGE
-        )
-        form_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
-        # Login header
-        header_label = tk.Label(
-            form_frame,
-            text="Login to Your Account",
-            font=("Helvetica", 18, "bold"),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            pady=PADDING_MEDIUM
-        )
-        header_label.pack(fill=tk.X)
-        
-        # Username field
-        username_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        username_frame.pack(fill=tk.X)
+        # Start from a fresh root frame
+        root_frame = self._reset_root_frame()
         
-        username_label = tk.Label(
-            username_frame,
-            text="Username:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
-        )
-        username_label.pack(side=tk.LEFT)
-        
-        self.username_var = tk.StringVar()
-        username_entry = tk.Entry(
-            username_frame,
-            textvariable=self.username_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        username_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        # Create a centered login form with its header
+        form_frame, header_label = _make_form_scaffold(root_frame, "Login to Your Account")
         
-        # Password field
-        password_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        password_frame.pack(fill=tk.X)
+        # Username and password fields
+        fields_frame = tk.Frame(form_frame, bg=BG_COLOR)
+        fields_frame.pack(fill=tk.X)
+        fields_frame.grid_columnconfigure(1, weight=1)
         
-        password_label = tk.Label(
-            password_frame,
-            text="Password:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
+        fields = (
+            ("Username:", 'username_entry', None),
+            ("Password:", 'password_entry', "*"),
         )
-        password_label.pack(side=tk.LEFT)
-        
-        self.password_var = tk.StringVar()
-        password_entry = tk.Entry(
-            password_frame,
-            textvariable=self.password_var,
-            show="*",
-            **ENTRY_STYLE,
-            width=30
-        )
-        password_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        for row, (text, attr, show) in enumerate(fields):
+            entry = _add_field(fields_frame, text, row, show)
+            entry.bindtags(('LoginEntry',) + entry.bindtags())
+            setattr(self, attr, entry)
         
         # Error message label
         self.error_var = tk.StringVar()
@@ -137,27 +311,14 @@ class LoginScreen(BaseScreen):
         login_button.pack(side=tk.LEFT, padx=(0, PADDING_SMALL))
         
         # Cancel button
-        cancel_button = HoverButton(
-            buttons_frame,
-            text="Cancel",
-            bg=TEXT_COLOR_LIGHT,
-            fg="white",
-            activebackground=TEXT_COLOR,
-            activeforeground="white",
-            font=("Helvetica", 12),
-            padx=15,
-            pady=5,
-            bd=0,
-            command=self.on_back
-        )
+        cancel_button = _make_cancel(buttons_frame, self.on_back)
         cancel_button.pack(side=tk.LEFT)
         
         # Set initial focus
-        username_entry.focus_set()
+        self.username_entry.focus_set()
         
-        # Bind enter key to login
-        username_entry.bind("<Return>", lambda e: self._handle_login())
-        password_entry.bind("<Return>", lambda e: self._handle_login())
+        # Bind enter key to login once for every tagged entry
+        form_frame.bind_class('LoginEntry', "<Return>", lambda e: self._handle_login())
     
     def _handle_login(self):
         """Handle login button press"""
@@ -165,8 +326,8 @@ class LoginScreen(BaseScreen):
         self.error_var.set("")
         
         # Get input values
-        username = self.username_var.get().strip()
-        password = self.password_var.get().strip()
+        username = _fast_strip(self.username_entry.get())
+        password = _fast_strip(self.password_entry.get())
         
         # Validate inputs
         if not username:
@@ -185,8 +346,8 @@ class LoginScreen(BaseScreen):
             if self.on_login_success:
                 self.on_login_success()
             # Clear fields
-            self.username_var.set("")
-            self.password_var.set("")
+            self.username_entry.delete(0, tk.END)
+            self.password_entry.delete(0, tk.END)
         else:
             # Show error message
             self.error_var.set(message)
@@ -195,11 +356,11 @@ class LoginScreen(BaseScreen):
         """Update the screen content"""
         super().update_screen()
         # Clear fields
-        if hasattr(self, 'username_var'):
-            self.username_var.set("")
-        if hasattr(self, 'password_var'):
-            self.password_var.set("")
-        if hasattr(self, 'error_var'):
+        for name in ('username_entry', 'password_entry'):
+            entry = self.__dict__.get(name)
+            if entry is not None:
+                entry.delete(0, tk.END)
+        if 'error_var' in self.__dict__:
             self.error_var.set("")
 
 class RegisterScreen(BaseScreen):
@@ -220,134 +381,32 @@ class RegisterScreen(BaseScreen):
     
     def _create_ui(self):
         """Create the registration screen UI"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create a centered registration form
-        form_frame = tk.Frame(
-            self.content_frame,
-            bg=BG_COLOR,
-            padx=PADDING_LARGE,
-            pady=PADDING_LARGE
-        )
-        form_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
-        # Registration header
-        header_label = tk.Label(
-            form_frame,
-            text="Create a New Account",
-            font=("Helvetica", 18, "bold"),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            pady=PADDING_MEDIUM
-        )
-        header_label.pack(fill=tk.X)
-        
-        # Username field
-        username_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        username_frame.pack(fill=tk.X)
-        
-        username_label = tk.Label(
-            username_frame,
-            text="Username:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
-        )
-        username_label.pack(side=tk.LEFT)
-        
-        self.username_var = tk.StringVar()
-        username_entry = tk.Entry(
-            username_frame,
-            textvariable=self.username_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        username_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        
-        # Email field
-        email_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        email_frame.pack(fill=tk.X)
-        
-        email_label = tk.Label(
-            email_frame,
-            text="Email:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
-        )
-        email_label.pack(side=tk.LEFT)
-        
-        self.email_var = tk.StringVar()
-        email_entry = tk.Entry(
-            email_frame,
-            textvariable=self.email_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        email_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        
-        # Password field
-        password_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        password_frame.pack(fill=tk.X)
-        
-        password_label = tk.Label(
-            password_frame,
-            text="Password:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
+        # Start from a fresh root frame
+        root_frame = self._reset_root_frame()
+        
+        # Create a centered registration form with its header
+        form_frame, header_label = _make_form_scaffold(root_frame, "Create a New Account")
+        
+        # Account fields
+        fields_frame = tk.Frame(form_frame, bg=BG_COLOR)
+        fields_frame.pack(fill=tk.X)
+        fields_frame.grid_columnconfigure(1, weight=1)
+        
+        fields = (
+            ("Username:", 'username_entry', None),
+            ("Email:", 'email_entry', None),
+            ("Password:", 'password_entry', "*"),
+            ("Confirm:", 'confirm_entry', "*"),
         )
-        password_label.pack(side=tk.LEFT)
-        
-        self.password_var = tk.StringVar()
-        password_entry = tk.Entry(
-            password_frame,
-            textvariable=self.password_var,
-            show="*",
-            **ENTRY_STYLE,
-            width=30
-        )
-        password_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        
-        # Confirm password field
-        confirm_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        confirm_frame.pack(fill=tk.X)
-        
-        confirm_label = tk.Label(
-            confirm_frame,
-            text="Confirm:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=10,
-            anchor='w'
-        )
-        confirm_label.pack(side=tk.LEFT)
-        
-        self.confirm_var = tk.StringVar()
-        confirm_entry = tk.Entry(
-            confirm_frame,
-            textvariable=self.confirm_var,
-            show="*",
-            **ENTRY_STYLE,
-            width=30
-        )
-        confirm_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        for row, (text, attr, show) in enumerate(fields):
+            entry = _add_field(fields_frame, text, row, show)
+            entry.bindtags(('RegisterEntry',) + entry.bindtags())
+            setattr(self, attr, entry)
         
         # Requirements info
-        requirements_text = f"Username must be at least {USERNAME_MIN_LENGTH} characters\n" \
-                           f"Password must be at least {PASSWORD_MIN_LENGTH} characters"
         requirements_label = tk.Label(
             form_frame,
-            text=requirements_text,
+            text=_REQUIREMENTS_TEXT,
             font=("Helvetica", 10),
             bg=BG_COLOR,
             fg=TEXT_COLOR_LIGHT,
@@ -382,29 +441,14 @@ class RegisterScreen(BaseScreen):
         register_button.pack(side=tk.LEFT, padx=(0, PADDING_SMALL))
         
         # Cancel button
-        cancel_button = HoverButton(
-            buttons_frame,
-            text="Cancel",
-            bg=TEXT_COLOR_LIGHT,
-            fg="white",
-            activebackground=TEXT_COLOR,
-            activeforeground="white",
-            font=("Helvetica", 12),
-            padx=15,
-            pady=5,
-            bd=0,
-            command=self.on_back
-        )
+        cancel_button = _make_cancel(buttons_frame, self.on_back)
         cancel_button.pack(side=tk.LEFT)
         
         # Set initial focus
-        username_entry.focus_set()
+        self.username_entry.focus_set()
         
-        # Bind enter key to register
-        username_entry.bind("<Return>", lambda e: self._handle_register())
-        email_entry.bind("<Return>", lambda e: self._handle_register())
-        password_entry.bind("<Return>", lambda e: self._handle_register())
-        confirm_entry.bind("<Return>", lambda e: self._handle_register())
+        # Bind enter key to register once for every tagged entry
+        form_frame.bind_class('RegisterEntry', "<Return>", lambda e: self._handle_register())
     
     def _handle_register(self):
         """Handle register button press"""
@@ -412,10 +456,10 @@ class RegisterScreen(BaseScreen):
         self.error_var.set("")
         
         # Get input values
-        username = self.username_var.get().strip()
-        email = self.email_var.get().strip()
-        password = self.password_var.get()
-        confirm = self.confirm_var.get()
+        username = _fast_strip(self.username_entry.get())
+        email = _fast_strip(self.email_entry.get())
+        password = self.password_entry.get()
+        confirm = self.confirm_entry.get()
         
         # Validate inputs
         if not username:
@@ -423,7 +467,7 @@ class RegisterScreen(BaseScreen):
             return
         
         if len(username) < USERNAME_MIN_LENGTH:
-            self.error_var.set(f"Username must be at least {USERNAME_MIN_LENGTH} characters")
+            self.error_var.set(_USERNAME_LENGTH_MSG)
             return
         
         if not password:
@@ -431,13 +475,17 @@ class RegisterScreen(BaseScreen):
             return
         
         if len(password) < PASSWORD_MIN_LENGTH:
-            self.error_var.set(f"Password must be at least {PASSWORD_MIN_LENGTH} characters")
+            self.error_var.set(_PASSWORD_LENGTH_MSG)
             return
         
         if password != confirm:
             self.error_var.set("Passwords do not match")
             return
         
+        if email and not _EMAIL_RE.match(email):
+            self.error_var.set("Invalid email")
+            return
+        
         # Attempt registration
         success, message = self.user_manager.register(username, password, email)
         
@@ -446,10 +494,10 @@ class RegisterScreen(BaseScreen):
             if self.on_register_success:
                 self.on_register_success()
             # Clear fields
-            self.username_var.set("")
-            self.email_var.set("")
-            self.password_var.set("")
-            self.confirm_var.set("")
+            self.username_entry.delete(0, tk.END)
+            self.email_entry.delete(0, tk.END)
+            self.password_entry.delete(0, tk.END)
+            self.confirm_entry.delete(0, tk.END)
         else:
             # Show error message
             self.error_var.set(message)
@@ -458,15 +506,11 @@ class RegisterScreen(BaseScreen):
         """Update the screen content"""
         super().update_screen()
         # Clear fields
-        if hasattr(self, 'username_var'):
-            self.username_var.set("")
-        if hasattr(self, 'email_var'):
-            self.email_var.set("")
-        if hasattr(self, 'password_var'):
-            self.password_var.set("")
-        if hasattr(self, 'confirm_var'):
-            self.confirm_var.set("")
-        if hasattr(self, 'error_var'):
+        for name in ('username_entry', 'email_entry', 'password_entry', 'confirm_entry'):
+            entry = self.__dict__.get(name)
+            if entry is not None:
+                entry.delete(0, tk.END)
+        if 'error_var' in self.__dict__:
             self.error_var.set("")
 
 class ProfileScreen(BaseScreen):
@@ -482,21 +526,28 @@ class ProfileScreen(BaseScreen):
         # Set screen title
         self.set_title("Profile")
         
-        # Initialize the UI
-        self._create_ui()
+        # The UI is built lazily on first show by update_screen
+        self._built = False
+        
+        # Avatar initial, cached per username
+        self._avatar_name = None
+        self._avatar_ch = 'U'
+        
+        # Preference display strings, cached per preferences snapshot
+        self._last_prefs_tuple = None
+        self._last_prefs_text = ('', '', '')
     
     def _create_ui(self):
         """Create the profile screen UI"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Start from a fresh root frame
+        root_frame = self._reset_root_frame()
         
         # Get current user
         user = self.user_manager.get_current_user()
         if not user:
             # Show a message if not logged in
             not_logged_label = tk.Label(
-                self.content_frame,
+                root_frame,
                 text="You must be logged in to view your profile",
                 font=("Helvetica", 14),
                 bg=BG_COLOR,
@@ -504,10 +555,12 @@ class ProfileScreen(BaseScreen):
                 pady=50
             )
             not_logged_label.pack(expand=True)
+            # Force a full rebuild once a user logs in
+            self._built = False
             return
         
         # Create a scrollable frame for the profile content
-        self.scroll_frame = ScrollableFrame(self.content_frame, bg=BG_COLOR)
+        self.scroll_frame = ScrollableFrame(root_frame, bg=BG_COLOR)
         self.scroll_frame.pack(fill=tk.BOTH, expand=True)
         
         # Main profile container
@@ -534,67 +587,51 @@ class ProfileScreen(BaseScreen):
         )
         avatar_frame.pack(side=tk.LEFT, padx=PADDING_MEDIUM)
         
-        # Add a placeholder avatar text
-        avatar_text = tk.Label(
-            avatar_canvas,
-            text=user.get('username', 'U')[0].upper(),
+        # Add a placeholder avatar text as a canvas item rather than a widget
+        self.avatar_canvas = avatar_canvas
+        self.avatar_text = avatar_canvas.create_text(
+            avatar_size // 2,
+            avatar_size // 2,
             font=("Helvetica", 36, "bold"),
-            bg=PRIMARY_COLOR,
-            fg="white"
+            fill="white"
         )
-        avatar_text.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
         
         # User info
         info_frame = tk.Frame(header_frame, bg=BG_COLOR, pady=PADDING_SMALL)
         info_frame.pack(side=tk.LEFT, fill=tk.Y, padx=PADDING_MEDIUM)
         
         # Username
-        username_label = tk.Label(
+        self.username_label = tk.Label(
             info_frame,
-            text=f"Username: {user.get('username', 'Unknown')}",
             font=("Helvetica", 14, "bold"),
             bg=BG_COLOR,
             fg=TEXT_COLOR,
             anchor='w',
             justify=tk.LEFT
         )
-        username_label.pack(anchor='w', pady=(0, PADDING_SMALL))
+        self.username_label.pack(anchor='w', pady=(0, PADDING_SMALL))
         
         # Email
-        email_label = tk.Label(
+        self.email_label = tk.Label(
             info_frame,
-            text=f"Email: {user.get('email', 'Not provided')}",
             font=("Helvetica", 12),
             bg=BG_COLOR,
             fg=TEXT_COLOR,
             anchor='w',
             justify=tk.LEFT
         )
-        email_label.pack(anchor='w', pady=(0, PADDING_SMALL))
+        self.email_label.pack(anchor='w', pady=(0, PADDING_SMALL))
         
         # Member since
-        created_at = user.get('created_at', '')
-        if created_at:
-            # Format date if it's available
-            try:
-                # Just take the date part
-                date_part = created_at.split('T')[0]
-                member_since = f"Member since: {date_part}"
-            except:
-                member_since = f"Member since: {created_at}"
-        else:
-            member_since = "Member since: Unknown"
-            
-        member_label = tk.Label(
+        self.member_label = tk.Label(
             info_frame,
-            text=member_since,
             font=("Helvetica", 12),
             bg=BG_COLOR,
             fg=TEXT_COLOR_LIGHT,
             anchor='w',
             justify=tk.LEFT
         )
-        member_label.pack(anchor='w')
+        self.member_label.pack(anchor='w')
         
         # Separator
         separator = ttk.Separator(profile_container, orient=tk.HORIZONTAL)
@@ -614,49 +651,25 @@ class ProfileScreen(BaseScreen):
         # Profile form
         form_frame = tk.Frame(profile_container, bg=BG_COLOR)
         form_frame.pack(fill=tk.X, padx=PADDING_MEDIUM)
+        form_frame.grid_columnconfigure(1, weight=1)
         
         # Display name field
-        name_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        name_frame.pack(fill=tk.X)
-        
-        name_label = tk.Label(
-            name_frame,
-            text="Display Name:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=15,
-            anchor='w'
-        )
-        name_label.pack(side=tk.LEFT)
-        
-        profile = user.get('profile', {})
-        self.display_name_var = tk.StringVar(value=profile.get('display_name', user.get('username', '')))
-        name_entry = tk.Entry(
-            name_frame,
-            textvariable=self.display_name_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        name_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        self.display_name_entry = _add_field(form_frame, "Display Name:", 0, lw=15)
         
         # Bio field
-        bio_frame = tk.Frame(form_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        bio_frame.pack(fill=tk.X)
-        
         bio_label = tk.Label(
-            bio_frame,
+            form_frame,
             text="Bio:",
-            font=("Helvetica", 12),
+            font=_LABEL_FONT,
             bg=BG_COLOR,
             fg=TEXT_COLOR,
             width=15,
             anchor='w'
         )
-        bio_label.pack(side=tk.LEFT, anchor='n')
+        bio_label.grid(row=1, column=0, sticky='nw', pady=PADDING_SMALL)
         
         self.bio_text = tk.Text(
-            bio_frame,
+            form_frame,
             font=("Helvetica", 12),
             bd=1,
             relief=tk.SOLID,
@@ -665,8 +678,7 @@ class ProfileScreen(BaseScreen):
             width=30,
             height=4
         )
-        self.bio_text.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        self.bio_text.insert('1.0', profile.get('bio', ''))
+        self.bio_text.grid(row=1, column=1, sticky='w', padx=PADDING_SMALL, pady=PADDING_SMALL)
         
         # Preferences section
         preferences_label = tk.Label(
@@ -682,84 +694,16 @@ class ProfileScreen(BaseScreen):
         # Preferences form
         pref_frame = tk.Frame(profile_container, bg=BG_COLOR)
         pref_frame.pack(fill=tk.X, padx=PADDING_MEDIUM)
+        pref_frame.grid_columnconfigure(1, weight=1)
         
-        # Get user preferences
-        preferences = profile.get('preferences', {})
-        
-        # Favorite genres
-        genres_frame = tk.Frame(pref_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        genres_frame.pack(fill=tk.X)
-        
-        genres_label = tk.Label(
-            genres_frame,
-            text="Favorite Genres:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=15,
-            anchor='w'
-        )
-        genres_label.pack(side=tk.LEFT)
-        
-        fav_genres = preferences.get('favorite_genres', [])
-        self.genres_var = tk.StringVar(value=', '.join(fav_genres))
-        genres_entry = tk.Entry(
-            genres_frame,
-            textvariable=self.genres_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        genres_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        
-        # Favorite directors
-        directors_frame = tk.Frame(pref_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        directors_frame.pack(fill=tk.X)
-        
-        directors_label = tk.Label(
-            directors_frame,
-            text="Favorite Directors:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=15,
-            anchor='w'
-        )
-        directors_label.pack(side=tk.LEFT)
-        
-        fav_directors = preferences.get('favorite_directors', [])
-        self.directors_var = tk.StringVar(value=', '.join(fav_directors))
-        directors_entry = tk.Entry(
-            directors_frame,
-            textvariable=self.directors_var,
-            **ENTRY_STYLE,
-            width=30
-        )
-        directors_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
-        
-        # Favorite actors
-        actors_frame = tk.Frame(pref_frame, bg=BG_COLOR, pady=PADDING_SMALL)
-        actors_frame.pack(fill=tk.X)
-        
-        actors_label = tk.Label(
-            actors_frame,
-            text="Favorite Actors:",
-            font=("Helvetica", 12),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            width=15,
-            anchor='w'
-        )
-        actors_label.pack(side=tk.LEFT)
-        
-        fav_actors = preferences.get('favorite_actors', [])
-        self.actors_var = tk.StringVar(value=', '.join(fav_actors))
-        actors_entry = tk.Entry(
-            actors_frame,
-            textvariable=self.actors_var,
-            **ENTRY_STYLE,
-            width=30
+        # Favorite genres, directors and actors
+        fields = (
+            ("Favorite Genres:", 'genres_entry'),
+            ("Favorite Directors:", 'directors_entry'),
+            ("Favorite Actors:", 'actors_entry'),
         )
-        actors_entry.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        for row, (text, attr) in enumerate(fields):
+            setattr(self, attr, _add_field(pref_frame, text, row, lw=15))
         
         # Format help
         format_label = tk.Label(
@@ -770,7 +714,7 @@ class ProfileScreen(BaseScreen):
             fg=TEXT_COLOR_LIGHT,
             anchor='w'
         )
-        format_label.pack(anchor='w', padx=(135, 0), pady=PADDING_SMALL)
+        format_label.grid(row=len(fields), column=1, sticky='w', padx=PADDING_SMALL, pady=PADDING_SMALL)
         
         # Buttons frame
         buttons_frame = tk.Frame(profile_container, bg=BG_COLOR, pady=PADDING_MEDIUM)
@@ -786,31 +730,62 @@ class ProfileScreen(BaseScreen):
         save_button.pack(side=tk.LEFT, padx=(0, PADDING_SMALL))
         
         # Cancel button
-        cancel_button = HoverButton(
-            buttons_frame,
-            text="Cancel",
-            bg=TEXT_COLOR_LIGHT,
-            fg="white",
-            activebackground=TEXT_COLOR,
-            activeforeground="white",
-            font=("Helvetica", 12),
-            padx=15,
-            pady=5,
-            bd=0,
-            command=self.on_back
-        )
+        cancel_button = _make_cancel(buttons_frame, self.on_back)
         cancel_button.pack(side=tk.LEFT)
+        
+        # Fill in the current user's details
+        self._refresh_profile(user)
+        self._built = True
+    
+    def _refresh_profile(self, user):
+        """Update the existing profile widgets in place with the user's data"""
+        g = user.get
+        uname = g('username', 'Unknown')
+        avatar_name = g('username', 'U')
+        if avatar_name != self._avatar_name:
+            self._avatar_name = avatar_name
+            self._avatar_ch = avatar_name[:1].upper() or 'U'
+        self.avatar_canvas.itemconfigure(self.avatar_text, text=self._avatar_ch)
+        self.username_label.config(text="Username: " + uname)
+        self.email_label.config(text="Email: " + g('email', 'Not provided'))
+        
+        # Member since - just take the date part of the timestamp
+        created_at = g('created_at', '')
+        date_part = created_at.partition('T')[0] if created_at else ''
+        self.member_label.config(text="Member since: " + (date_part or 'Unknown'))
+        
+        profile = g('profile', {})
+        _set_entry_text(self.display_name_entry, profile.get('display_name', g('username', '')))
+        self.bio_text.delete('1.0', tk.END)
+        self.bio_text.insert('1.0', profile.get('bio', ''))
+        
+        # User preferences - only re-join the lists when they have changed
+        preferences = profile.get('preferences', {})
+        prefs = (
+            tuple(preferences.get('favorite_genres', [])),
+            tuple(preferences.get('favorite_directors', [])),
+            tuple(preferences.get('favorite_actors', []))
+        )
+        if prefs != self._last_prefs_tuple:
+            self._last_prefs_tuple = prefs
+            self._last_prefs_text = tuple(', '.join(p) for p in prefs)
+        
+        # Skip writes that would not change the entry
+        pref_entries = (self.genres_entry, self.directors_entry, self.actors_entry)
+        for entry, text in zip(pref_entries, self._last_prefs_text):
+            if entry.get() != text:
+                _set_entry_text(entry, text)
     
     def _handle_save(self):
         """Handle save button press"""
         # Get input values
-        display_name = self.display_name_var.get().strip()
+        display_name = self.display_name_entry.get().strip()
         bio = self.bio_text.get("1.0", tk.END).strip()
         
         # Parse comma-separated lists
-        genres = [g.strip() for g in self.genres_var.get().split(',') if g.strip()]
-        directors = [d.strip() for d in self.directors_var.get().split(',') if d.strip()]
-        actors = [a.strip() for a in self.actors_var.get().split(',') if a.strip()]
+        genres = _split_csv(self.genres_entry.get())
+        directors = _split_csv(self.directors_entry.get())
+        actors = _split_csv(self.actors_entry.get())
         
         # Create profile data
         profile_data = {
@@ -830,8 +805,147 @@ class ProfileScreen(BaseScreen):
     def update_screen(self):
         """Update the screen content"""
         super().update_screen()
-        # Recreate UI to reflect any changes
-        self._create_ui()
+        user = self.user_manager.get_current_user()
+        if user and self._built:
+            # Widgets already exist, just refresh their contents
+            self._refresh_profile(user)
+            # The wheel is bound globally, so reclaim it from the last screen built
+            self.scroll_frame.bind_mousewheel()
+        else:
+            self._create_ui()
+
+class _WatchlistRow:
+    """A recyclable watchlist row whose labels are rebound to a new movie in place"""
+    
+    default_icon = "🎬"
+    
+    def __init__(self, parent, screen, slot, parity):
+        self.slot = slot
+        self.parity = parity
+        self.icon_text = None
+        
+        # Rows only ever serve one parity, so their alternating background is fixed
+        bg_color = _ROW_BACKGROUNDS[parity]
+        
+        # Local aliases keep the widget constructors out of the global/attribute lookup path
+        Frame, Label = tk.Frame, tk.Label
+        
+        # Create a frame for the movie item
+        self.frame = Frame(
+            parent,
+            bg=bg_color,
+            padx=PADDING_MEDIUM,
+            pady=PADDING_MEDIUM,
+            bd=0
+        )
+        
+        # Left side with movie info
+        self.info_frame = Frame(self.frame, bg=bg_color)
+        self.info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, anchor='w')
+        
+        # Movie title with genre icon
+        self.title_frame = Frame(self.info_frame, bg=bg_color)
+        self.title_frame.pack(fill=tk.X, anchor='w')
+        
+        self.icon_label = Label(
+            self.title_frame,
+            font=_ROW_ICON_FONT,
+            bg=bg_color,
+            fg=PRIMARY_COLOR
+        )
+        self.icon_label.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.title_label = Label(
+            self.title_frame,
+            font=_ROW_TITLE_FONT,
+            bg=bg_color,
+            fg=TEXT_COLOR,
+            anchor='w'
+        )
+        self.title_label.pack(side=tk.LEFT)
+        
+        # Year, rating and added date share one label
+        self.details_label = Label(
+            self.info_frame,
+            font=_ROW_META_FONT,
+            bg=bg_color,
+            fg=TEXT_COLOR_LIGHT,
+            pady=5,
+            anchor='w'
+        )
+        self.details_label.pack(fill=tk.X, anchor='w')
+        
+        # Right side with buttons
+        self.button_frame = Frame(self.frame, bg=bg_color)
+        self.button_frame.pack(side=tk.RIGHT, padx=(PADDING_MEDIUM, 0))
+        
+        # Buttons dispatch through the screen to whichever movie occupies this slot
+        dispatch = screen._dispatch_row
+        view_button = _ViewDetailsButton(
+            self.button_frame,
+            command=functools.partial(dispatch, screen._handle_view, slot)
+        )
+        view_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        
+        # Mark as watched button (placeholder for future feature)
+        watched_button = HoverButton(
+            self.button_frame,
+            text="✓ Watched",
+            bg="#4CAF50",  # Green
+            fg=TEXT_COLOR_INVERSE,
+            hover_bg="#388E3C",
+            activebackground="#388E3C",
+            activeforeground=TEXT_COLOR_INVERSE,
+            font=("Helvetica", 12),
+            padx=10,
+            pady=5,
+            bd=0,
+            command=functools.partial(dispatch, screen._handle_watched, slot)
+        )
+        watched_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        
+        remove_button = HoverButton(
+            self.button_frame,
+            text="Remove",
+            **ACCENT_BUTTON_STYLE,
+            command=functools.partial(dispatch, screen._handle_remove, slot)
+        )
+        remove_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
+    
+    def bind(self, movie):
+        """Point the row at a movie and update its widgets in place"""
+        get = movie.get
+        
+        # Different icons based on genre if available
+        icon_text = self.default_icon
+        genres = get('genres', [])
+        if genres:
+            if isinstance(genres, str):
+                genres = [g.strip() for g in genres.split(',')]
+            icon_text = next((GENRE_ICONS[g] for g in genres if g in GENRE_ICONS), icon_text)
+        
+        # Emoji glyphs are costly to shape, so only touch the icon when it changes
+        if icon_text != self.icon_text:
+            self.icon_text = icon_text
+            self.icon_label.config(text=icon_text)
+        
+        self.title_label.config(text=get('title', 'Unknown Title'))
+        
+        # Only show the details the movie actually has
+        details = []
+        year = get('release_year', '')
+        if year:
+            details.append(f"📅 {year}")
+        
+        rating = get('vote_average', None)
+        if rating is not None:
+            details.append(f"⭐ {rating}/10")
+        
+        added_date = get('added_at', '')
+        if added_date:
+            details.append(_added_date_text(added_date))
+        
+        self.details_label.config(text=_DETAILS_SEPARATOR.join(details))
 
 class WatchlistScreen(BaseScreen):
     """Screen for displaying and managing user's watchlist"""
@@ -848,20 +962,47 @@ class WatchlistScreen(BaseScreen):
         # Set screen title
         self.set_title("My Watchlist")
         
-        # Initialize the UI
-        self._create_ui()
+        # Popular movie suggestions for the empty state, fetched once
+        self._popular_cache = None
+        
+        # Background recommendations, cached per watchlist (tuple of movie ids)
+        self._rec_executor = None
+        self._rec_cache = OrderedDict()
+        self._rec_futures = {}
+        self._rec_key = None
+        self._rec_body = None
+        
+        # User whose populated watchlist is currently built, if any
+        self._built_for = None
+        
+        # Watchlist fetched from the user manager, cleared whenever it may have changed
+        self._watchlist_cache = None
+        
+        # Per-movie (added, title, rating) sort keys for the cached watchlist
+        self._sort_keys_source = None
+        self._sort_keys = []
+        
+        # Windowed row state for the watchlist
+        self._sorted_watchlist = []
+        self._row_widgets = {}
+        self._row_pools = ([], [])
+        self._row_movies = []
+        self._pool_container = None
+        self._window = (0, 0)
+        self._item_height = None
+        self._refresh_pending = None
     
     def _create_ui(self):
         """Create the watchlist screen UI"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Start from a fresh root frame
+        root_frame = self._reset_root_frame()
+        self._built_for = None
         
         # Get current user
         user = self.user_manager.get_current_user()
         if not user:
             # Show a more attractive message if not logged in
-            login_frame = tk.Frame(self.content_frame, bg=BG_COLOR, padx=50, pady=50)
+            login_frame = tk.Frame(root_frame, bg=BG_COLOR, padx=50, pady=50)
             login_frame.pack(expand=True)
             
             not_logged_label = tk.Label(
@@ -904,7 +1045,7 @@ class WatchlistScreen(BaseScreen):
             return
         
         # Create a main frame with two columns
-        main_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
+        main_frame = tk.Frame(root_frame, bg=BG_COLOR)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Left column for watchlist (2/3 width)
@@ -920,70 +1061,17 @@ class WatchlistScreen(BaseScreen):
         self.scroll_frame = ScrollableFrame(left_column, bg=BG_COLOR)
         self.scroll_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Watchlist header with count badge
-        header_frame = tk.Frame(self.scroll_frame.scrollable_frame, bg=BG_COLOR)
-        header_frame.pack(fill=tk.X, anchor='w', pady=(0, PADDING_MEDIUM))
-        
-        header_label = tk.Label(
-            header_frame,
-            text="My Watchlist",
-            font=("Helvetica", 20, "bold"),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            anchor='w'
-        )
-        header_label.pack(side=tk.LEFT)
+        # Re-window the rows whenever the view scrolls or resizes
+        self.scroll_frame.canvas.configure(yscrollcommand=self._on_watchlist_scroll)
         
         # Get watchlist
-        watchlist = self.user_manager.get_watchlist()
-        
-        # Add count badge
-        count_badge = tk.Label(
-            header_frame,
-            text=str(len(watchlist)),
-            font=("Helvetica", 12, "bold"),
-            bg=PRIMARY_COLOR,
-            fg=TEXT_COLOR_INVERSE,
-            padx=10,
-            pady=2,
-            borderwidth=0
-        )
-        count_badge.pack(side=tk.LEFT, padx=10)
-        
-        # Add sorting options
-        sort_frame = tk.Frame(header_frame, bg=BG_COLOR)
-        sort_frame.pack(side=tk.RIGHT)
+        watchlist = self._get_watchlist()
         
-        sort_label = tk.Label(
-            sort_frame,
-            text="Sort by:",
-            font=("Helvetica", 10),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR_LIGHT
+        # Watchlist header with count badge and sort options
+        header_frame, self._count_badge = self._build_sortable_list_header(
+            self.scroll_frame.scrollable_frame, "My Watchlist", watchlist, PRIMARY_COLOR, self._resort_watchlist
         )
-        sort_label.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Sort buttons
-        self.sort_options = ["Date Added", "Title", "Rating"]
-        self.active_sort = tk.StringVar(value=self.sort_options[0])
-        
-        for option in self.sort_options:
-            sort_button = tk.Radiobutton(
-                sort_frame,
-                text=option,
-                variable=self.active_sort,
-                value=option,
-                font=("Helvetica", 10),
-                bg=BG_COLOR,
-                fg=TEXT_COLOR,
-                selectcolor=BG_COLOR,
-                command=self._resort_watchlist,
-                indicatoron=False,
-                bd=0,
-                padx=8,
-                pady=2
-            )
-            sort_button.pack(side=tk.LEFT, padx=2)
+        header_frame.pack(fill=tk.X, anchor='w', pady=(0, PADDING_MEDIUM))
         
         # Watchlist container
         self.watchlist_container = tk.Frame(
@@ -993,6 +1081,8 @@ class WatchlistScreen(BaseScreen):
         self.watchlist_container.pack(fill=tk.BOTH, expand=True)
         
         if not watchlist:
+            self._sorted_watchlist = []
+            
             # Show an empty state with suggestions
             empty_frame = tk.Frame(self.watchlist_container, bg=BG_COLOR, pady=30)
             empty_frame.pack(fill=tk.X)
@@ -1038,7 +1128,9 @@ class WatchlistScreen(BaseScreen):
             suggestion_label.pack()
             
             # Get some popular movie suggestions
-            popular_movies = self.data_handler.get_popular_movies(limit=3)
+            if self._popular_cache is None:
+                self._popular_cache = self.data_handler.get_popular_movies(limit=3)
+            popular_movies = self._popular_cache
             suggestions_frame = tk.Frame(empty_frame, bg=BG_COLOR)
             suggestions_frame.pack(pady=10)
             
@@ -1062,10 +1154,8 @@ class WatchlistScreen(BaseScreen):
                 )
                 movie_title.pack(pady=5)
                 
-                view_button = HoverButton(
+                view_button = _ViewDetailsButton(
                     suggestion,
-                    text="View Details",
-                    **BUTTON_STYLE,
                     command=lambda m=movie: self._handle_view(m)
                 )
                 view_button.pack(pady=5)
@@ -1073,192 +1163,165 @@ class WatchlistScreen(BaseScreen):
             # Sort the watchlist based on current criteria
             self._populate_watchlist(watchlist)
         
-        # Now populate the right sidebar
-        self._create_sidebar(right_column, watchlist)
+        # Populate the right sidebar once the list has had a chance to paint
+        self.set_status("Loading watchlist stats...")
+        self.after_idle(self._finish_sidebar, right_column, watchlist, user.get('id'))
+    
+    def _finish_sidebar(self, container, watchlist, user_id):
+        """Build the deferred sidebar and mark the screen as ready for in-place refreshes"""
+        # The screen may have been rebuilt before the idle callback ran
+        if not container.winfo_exists():
+            return
+        
+        self._create_sidebar(container, watchlist)
+        
+        # Later updates for this user can refresh the populated list in place
+        if watchlist:
+            self._built_for = user_id
         
         # Set status
         self.set_status(f"Watchlist: {len(watchlist)} movies")
     
     def _populate_watchlist(self, watchlist):
         """Populate the watchlist with movie items"""
-        # Clear existing items
-        for widget in self.watchlist_container.winfo_children():
-            widget.destroy()
-            
-        # Sort watchlist based on selected option
-        sort_option = self.active_sort.get()
-        if sort_option == "Date Added":
-            sorted_watchlist = sorted(watchlist, key=lambda m: m.get('added_at', ''), reverse=True)
-        elif sort_option == "Title":
-            sorted_watchlist = sorted(watchlist, key=lambda m: m.get('title', '').lower())
-        elif sort_option == "Rating":
-            sorted_watchlist = sorted(watchlist, key=lambda m: float(m.get('vote_average', 0)), reverse=True)
+        container = self.watchlist_container
+        
+        # Detach the container so the rebuilt rows get laid out in one pass
+        container.pack_forget()
+        
+        if self._pool_container is not container:
+            # A fresh container needs its own spacers and row pool
+            self._pool_container = container
+            self._row_pools = ([], [])
+            self._row_movies = []
+            self._top_spacer = tk.Frame(container, bg=BG_COLOR, height=0)
+            self._top_spacer.pack(fill=tk.X)
+            self._bottom_spacer = tk.Frame(container, bg=BG_COLOR, height=0)
+            self._bottom_spacer.pack(fill=tk.X)
+            self._item_height = None
         else:
+            # Return the visible rows to the pool rather than destroying them
+            for row in self._row_widgets.values():
+                row.frame.pack_forget()
+                self._row_pools[row.parity].append(row)
+        self._row_widgets = {}
+        self._window = (0, 0)
+            
+        # Sort keys are computed once per fetched watchlist
+        if self._sort_keys_source is not watchlist:
+            self._sort_keys_source = watchlist
+            self._sort_keys = [
+                (m.get('added_at', ''), m.get('title', '').lower(), float(m.get('vote_average', 0) or 0))
+                for m in watchlist
+            ]
+        
+        # Sort watchlist based on selected option
+        column, reverse = _WATCHLIST_SORT_COLUMNS.get(self.active_sort.get(), (None, False))
+        if column is None:
             sorted_watchlist = watchlist
-            
-        # Add each watchlist item with improved styling
-        for i, movie in enumerate(sorted_watchlist):
-            # Alternate background color for better readability
-            bg_color = BG_COLOR if i % 2 == 0 else "#f0f0f5"
-            
-            # Create a frame for the movie item
-            item_frame = tk.Frame(
-                self.watchlist_container,
-                bg=bg_color,
-                padx=PADDING_MEDIUM,
-                pady=PADDING_MEDIUM,
-                bd=0
-            )
-            item_frame.pack(fill=tk.X, pady=1)
-            
-            # Left side with movie info
-            info_frame = tk.Frame(item_frame, bg=bg_color)
-            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, anchor='w')
-            
-            # Movie title with genre icon
-            title_frame = tk.Frame(info_frame, bg=bg_color)
-            title_frame.pack(fill=tk.X, anchor='w')
-            
-            # Different icons based on genre if available
-            icon_text = "🎬"
-            genres = movie.get('genres', [])
-            if genres:
-                if isinstance(genres, str):
-                    genres = [g.strip() for g in genres.split(',')]
-                
-                # Map genres to emojis
-                genre_icons = {
-                    'Action': '💥', 'Adventure': '🌄', 'Animation': '🧸',
-                    'Comedy': '😄', 'Crime': '🕵️', 'Documentary': '📹',
-                    'Drama': '🎭', 'Family': '👨‍👩‍👧‍👦', 'Fantasy': '🧙',
-                    'History': '📜', 'Horror': '👻', 'Music': '🎵',
-                    'Mystery': '🔍', 'Romance': '❤️', 'Science Fiction': '🚀',
-                    'TV Movie': '📺', 'Thriller': '😱', 'War': '⚔️',
-                    'Western': '🤠'
-                }
-                
-                for genre in genres:
-                    if genre in genre_icons:
-                        icon_text = genre_icons[genre]
-                        break
-            
-            # Icon label
-            icon_label = tk.Label(
-                title_frame,
-                text=icon_text,
-                font=("Helvetica", 16),
-                bg=bg_color,
-                fg=PRIMARY_COLOR
-            )
-            icon_label.pack(side=tk.LEFT, padx=(0, 5))
-            
-            # Movie title
-            title_label = tk.Label(
-                title_frame,
-                text=movie.get('title', 'Unknown Title'),
-                font=("Helvetica", 14, "bold"),
-                bg=bg_color,
-                fg=TEXT_COLOR,
-                anchor='w'
-            )
-            title_label.pack(side=tk.LEFT)
-            
-            # Details frame
-            details_frame = tk.Frame(info_frame, bg=bg_color, pady=5)
-            details_frame.pack(fill=tk.X, anchor='w')
-            
-            # Year if available
-            year = movie.get('release_year', '')
-            if year:
-                year_label = tk.Label(
-                    details_frame,
-                    text=f"📅 {year}",
-                    font=("Helvetica", 10),
-                    bg=bg_color,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                year_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            # Rating if available
-            rating = movie.get('vote_average', None)
-            if rating is not None:
-                rating_label = tk.Label(
-                    details_frame,
-                    text=f"⭐ {rating}/10",
-                    font=("Helvetica", 10),
-                    bg=bg_color,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                rating_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            # Added date
-            added_date = movie.get('added_at', '')
-            if added_date:
-                try:
-                    # Format the date nicely
-                    date_obj = datetime.fromisoformat(added_date)
-                    date_text = f"Added: {date_obj.strftime('%B %d, %Y')}"
-                except:
-                    # Just take the date part as fallback
-                    try:
-                        date_part = added_date.split('T')[0]
-                        date_text = f"Added: {date_part}"
-                    except:
-                        date_text = f"Added: {added_date}"
-                
-                date_label = tk.Label(
-                    details_frame,
-                    text=date_text,
-                    font=("Helvetica", 10),
-                    bg=bg_color,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                date_label.pack(side=tk.LEFT)
-            
-            # Right side with buttons
-            button_frame = tk.Frame(item_frame, bg=bg_color)
-            button_frame.pack(side=tk.RIGHT, padx=(PADDING_MEDIUM, 0))
-            
-            # View button
-            view_button = HoverButton(
-                button_frame,
-                text="View Details",
-                **BUTTON_STYLE,
-                command=lambda m=movie: self._handle_view(m)
-            )
-            view_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
-            
-            # Mark as watched button (placeholder for future feature)
-            watched_button = HoverButton(
-                button_frame,
-                text="✓ Watched",
-                bg="#4CAF50",  # Green
-                fg=TEXT_COLOR_INVERSE,
-                hover_bg="#388E3C",
-                activebackground="#388E3C",
-                activeforeground=TEXT_COLOR_INVERSE,
-                font=("Helvetica", 12),
-                padx=10,
-                pady=5,
-                bd=0,
-                command=lambda m=movie: self._handle_watched(m)
-            )
-            watched_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
-            
-            # Remove button
-            remove_button = HoverButton(
-                button_frame,
-                text="Remove",
-                **ACCENT_BUTTON_STYLE,
-                command=lambda m=movie: self._handle_remove(m)
-            )
-            remove_button.pack(side=tk.LEFT, padx=PADDING_SMALL)
+        else:
+            column_keys = list(map(itemgetter(column), self._sort_keys))
+            order = sorted(range(len(watchlist)), key=column_keys.__getitem__, reverse=reverse)
+            sorted_watchlist = [watchlist[i] for i in order]
+        self._sorted_watchlist = sorted_watchlist
+        
+        if sorted_watchlist:
+            if self._item_height is None:
+                # Measure one rendered row to size the spacers
+                row = self._acquire_row(0)
+                row.frame.pack(fill=tk.X, pady=1, before=self._bottom_spacer)
+                self._row_widgets[0] = row
+                container.update_idletasks()
+                self._item_height = max(row.frame.winfo_reqheight() + 2, 1)
+            
+            self._refresh_visible()
+        else:
+            self._top_spacer.config(height=0)
+            self._bottom_spacer.config(height=0)
+        
+        # Reattach and lay everything out once
+        container.pack(fill=tk.BOTH, expand=True)
+        self.scroll_frame.scrollable_frame.update_idletasks()
+    
+    def _acquire_row(self, index):
+        """Take a row from the pool, or create one, and bind it to a sorted index"""
+        # Alternate background color for better readability, via per-parity pools
+        parity = index % 2
+        pool = self._row_pools[parity]
+        if pool:
+            row = pool.pop()
+        else:
+            row = _WatchlistRow(self.watchlist_container, self, len(self._row_movies), parity)
+            self._row_movies.append(None)
+        
+        movie = self._sorted_watchlist[index]
+        self._row_movies[row.slot] = movie
+        row.bind(movie)
+        return row
+    
+    def _dispatch_row(self, handler, slot):
+        """Run a row button handler on the movie currently bound to that row"""
+        handler(self._row_movies[slot])
+    
+    def _on_watchlist_scroll(self, first, last):
+        """Keep the scrollbar in sync and re-window the rows after the view moves"""
+        self.scroll_frame.scrollbar.set(first, last)
+        if self._refresh_pending is None:
+            self._refresh_pending = self.after_idle(self._refresh_visible)
+    
+    def _refresh_visible(self):
+        """Render only the rows that intersect the viewport, plus an overscan"""
+        self._refresh_pending = None
+        items = self._sorted_watchlist
+        container = self.watchlist_container
+        if not items or not container.winfo_exists():
+            return
+        
+        # Map the canvas viewport onto row indices
+        item_height = self._item_height
+        n = len(items)
+        start, end = _visible_span(self.scroll_frame, container, item_height, n, _WATCHLIST_OVERSCAN)
+        
+        # Recycle rows that left the window
+        rows = self._row_widgets
+        for index in [i for i in rows if i < start or i >= end]:
+            row = rows.pop(index)
+            row.frame.pack_forget()
+            self._row_pools[row.parity].append(row)
+        
+        # Bind rows that entered the window, keeping them in sorted order
+        for index in range(start, end):
+            if index in rows:
+                continue
+            row = self._acquire_row(index)
+            following = next((rows[i].frame for i in range(index + 1, end) if i in rows), self._bottom_spacer)
+            row.frame.pack(fill=tk.X, pady=1, before=following)
+            rows[index] = row
+        
+        # Spacers preserve the full scroll extent
+        window = (start, end)
+        if window != self._window:
+            self._window = window
+            self._top_spacer.config(height=start * item_height)
+            self._bottom_spacer.config(height=(n - end) * item_height)
     
     def _create_sidebar(self, container, watchlist):
         """Create the sidebar with stats and recommendations"""
         # Stats section
-        stats_frame = tk.Frame(container, bg=BG_COLOR, bd=1, relief=tk.SOLID, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
-        stats_frame.pack(fill=tk.X, pady=(0, PADDING_MEDIUM))
+        self._stats_frame = tk.Frame(container, bg=BG_COLOR, bd=1, relief=tk.SOLID, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+        self._stats_frame.pack(fill=tk.X, pady=(0, PADDING_MEDIUM))
+        self._refresh_stats(watchlist)
+        
+        # If we have a recommender and watchlist, show recommendations
+        if self.recommender and watchlist and len(watchlist) > 0:
+            self._rec_frame = tk.Frame(container, bg=BG_COLOR, bd=1, relief=tk.SOLID, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+            self._rec_frame.pack(fill=tk.X)
+            self._refresh_recommendations(watchlist)
+    
+    def _refresh_stats(self, watchlist):
+        """Refill the stats section from the given watchlist"""
+        stats_frame = self._stats_frame
+        destroy_children(stats_frame)
         
         stats_title = tk.Label(
             stats_frame,
@@ -1269,9 +1332,10 @@ class WatchlistScreen(BaseScreen):
         )
         stats_title.pack(anchor='w', pady=(0, PADDING_MEDIUM))
         
-        # Calculate stats
-        genres_count = {}
-        years_count = {}
+        # Calculate stats in a single pass
+        genres_count = Counter()
+        decades_count = Counter()
+        distinct_years = set()
         total_rating = 0
         rating_count = 0
         
@@ -1281,14 +1345,15 @@ class WatchlistScreen(BaseScreen):
             if movie_genres:
                 if isinstance(movie_genres, str):
                     movie_genres = [g.strip() for g in movie_genres.split(',')]
-                for genre in movie_genres:
-                    if genre:
-                        genres_count[genre] = genres_count.get(genre, 0) + 1
+                genres_count.update(genre for genre in movie_genres if genre)
             
-            # Years
+            # Years, bucketed straight into decades
             year = movie.get('release_year', '')
             if year:
-                years_count[year] = years_count.get(year, 0) + 1
+                distinct_years.add(year)
+                year_str = str(year)[:4]
+                if year_str.isdigit():
+                    decades_count[int(year_str) // 10 * 10] += 1
             
             # Ratings
             rating = movie.get('vote_average', None)
@@ -1302,7 +1367,7 @@ class WatchlistScreen(BaseScreen):
         
         # Display top genres
         if genres_count:
-            top_genres = sorted(genres_count.items(), key=lambda x: x[1], reverse=True)[:3]
+            top_genres = genres_count.most_common(3)
             
             genres_label = tk.Label(
                 stats_frame,
@@ -1364,18 +1429,8 @@ class WatchlistScreen(BaseScreen):
             rating_value.pack(side=tk.RIGHT)
         
         # Add distribution by decade if we have year data
-        if years_count and len(years_count) > 1:
-            decades = {}
-            for year_str, count in years_count.items():
-                try:
-                    year = int(year_str)
-                    decade = (year // 10) * 10
-                    decade_name = f"{decade}s"
-                    decades[decade_name] = decades.get(decade_name, 0) + count
-                except:
-                    pass
-            
-            if decades:
+        if len(distinct_years) > 1:
+            if decades_count:
                 decades_label = tk.Label(
                     stats_frame,
                     text="Movies by Decade:",
@@ -1387,15 +1442,13 @@ class WatchlistScreen(BaseScreen):
                 decades_label.pack(fill=tk.X, pady=(10, 5))
                 
                 # Sort decades
-                sorted_decades = sorted(decades.items(), key=lambda x: x[0])
-                
-                for decade, count in sorted_decades:
+                for decade, count in sorted(decades_count.items()):
                     decade_item = tk.Frame(stats_frame, bg=BG_COLOR)
                     decade_item.pack(fill=tk.X, pady=2)
                     
                     decade_name = tk.Label(
                         decade_item,
-                        text=decade,
+                        text=f"{decade}s",
                         font=("Helvetica", 10),
                         bg=BG_COLOR,
                         fg=TEXT_COLOR,
@@ -1412,112 +1465,174 @@ class WatchlistScreen(BaseScreen):
                         padx=5
                     )
                     decade_count.pack(side=tk.RIGHT)
+    
+    def _refresh_recommendations(self, watchlist):
+        """Refill the recommendations section from the given watchlist"""
+        rec_frame = self._rec_frame
+        destroy_children(rec_frame)
+        
+        rec_title = tk.Label(
+            rec_frame,
+            text="Recommended For You",
+            font=("Helvetica", 14, "bold"),
+            bg=BG_COLOR,
+            fg=TEXT_COLOR
+        )
+        rec_title.pack(anchor='w', pady=(0, PADDING_MEDIUM))
         
-        # If we have a recommender and watchlist, show recommendations
-        if self.recommender and watchlist and len(watchlist) > 0:
-            rec_frame = tk.Frame(container, bg=BG_COLOR, bd=1, relief=tk.SOLID, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
-            rec_frame.pack(fill=tk.X)
-            
-            rec_title = tk.Label(
-                rec_frame,
-                text="Recommended For You",
-                font=("Helvetica", 14, "bold"),
+        self._rec_body = tk.Frame(rec_frame, bg=BG_COLOR)
+        self._rec_body.pack(fill=tk.X)
+        
+        # Reuse recommendations already computed for this exact watchlist
+        key = tuple(m.get('id') for m in watchlist)
+        self._rec_key = key
+        if key in self._rec_cache:
+            self._rec_cache.move_to_end(key)
+            self._install_recommendations(self._rec_body, self._rec_cache[key])
+            return
+        
+        loading_label = tk.Label(
+            self._rec_body,
+            text="Loading recommendations...",
+            font=("Helvetica", 10),
+            bg=BG_COLOR,
+            fg=TEXT_COLOR_LIGHT
+        )
+        loading_label.pack(anchor='w')
+        
+        # Get recommendations based on watchlist off the Tk thread
+        future = self._rec_futures.get(key)
+        if future is None:
+            if self._rec_executor is None:
+                self._rec_executor = ThreadPoolExecutor(max_workers=1)
+            future = self._rec_executor.submit(
+                self.recommender.get_recommendations_for_watchlist, list(watchlist), limit=3
+            )
+            self._rec_futures[key] = future
+        self.after(_REC_POLL_MS, self._poll_recommendations, future, key)
+    
+    def _poll_recommendations(self, future, key):
+        """Install background recommendations on the Tk thread once they are ready"""
+        if future.cancelled():
+            # The screen was destroyed and its executor shut down
+            return
+        if not future.done():
+            self.after(_REC_POLL_MS, self._poll_recommendations, future, key)
+            return
+        
+        self._rec_futures.pop(key, None)
+        try:
+            recommendations = future.result()
+        except Exception:
+            recommendations = None
+        else:
+            self._rec_cache[key] = recommendations
+            if len(self._rec_cache) > _REC_CACHE_SIZE:
+                self._rec_cache.popitem(last=False)
+        
+        # Skip results for a watchlist that is no longer on screen
+        if key == self._rec_key and self._rec_body.winfo_exists():
+            self._install_recommendations(self._rec_body, recommendations)
+    
+    def destroy(self):
+        """Stop the recommendation worker along with the screen"""
+        if self._rec_executor is not None:
+            self._rec_executor.shutdown(wait=False, cancel_futures=True)
+            self._rec_executor = None
+        super().destroy()
+    
+    def _install_recommendations(self, body, recommendations):
+        """Show recommendation items, or None when they could not be generated"""
+        destroy_children(body)
+        
+        if recommendations is None:
+            error_label = tk.Label(
+                body,
+                text="Unable to generate recommendations at this time",
+                font=("Helvetica", 10),
                 bg=BG_COLOR,
-                fg=TEXT_COLOR
+                fg=TEXT_COLOR_LIGHT,
+                wraplength=250
             )
-            rec_title.pack(anchor='w', pady=(0, PADDING_MEDIUM))
-            
-            # Get recommendations based on watchlist
-            try:
-                recommendations = self.recommender.get_recommendations_for_watchlist(
-                    watchlist, limit=3
+            error_label.pack()
+            return
+        
+        if recommendations:
+            for rec in recommendations:
+                rec_item = tk.Frame(body, bg=BG_COLOR, pady=5)
+                rec_item.pack(fill=tk.X)
+                
+                title_label = tk.Label(
+                    rec_item,
+                    text=truncate_text(rec.get('title', 'Unknown'), 25),
+                    font=("Helvetica", 12, "bold"),
+                    bg=BG_COLOR,
+                    fg=TEXT_COLOR,
+                    anchor='w'
                 )
+                title_label.pack(anchor='w')
                 
-                if recommendations:
-                    for rec in recommendations:
-                        rec_item = tk.Frame(rec_frame, bg=BG_COLOR, pady=5)
-                        rec_item.pack(fill=tk.X)
-                        
-                        title_label = tk.Label(
-                            rec_item,
-                            text=truncate_text(rec.get('title', 'Unknown'), 25),
-                            font=("Helvetica", 12, "bold"),
-                            bg=BG_COLOR,
-                            fg=TEXT_COLOR,
-                            anchor='w'
-                        )
-                        title_label.pack(anchor='w')
-                        
-                        # Details row
-                        details_frame = tk.Frame(rec_item, bg=BG_COLOR)
-                        details_frame.pack(fill=tk.X, pady=2)
-                        
-                        # Year if available
-                        year = rec.get('release_year', '')
-                        if not year and 'release_date' in rec:
-                            year_match = re.search(r'(\d{4})', str(rec['release_date']))
-                            if year_match:
-                                year = year_match.group(1)
-                        
-                        if year:
-                            year_label = tk.Label(
-                                details_frame,
-                                text=f"{year}",
-                                font=("Helvetica", 10),
-                                bg=BG_COLOR,
-                                fg=TEXT_COLOR_LIGHT
-                            )
-                            year_label.pack(side=tk.LEFT, padx=(0, 10))
-                        
-                        # Rating if available
-                        rating = rec.get('vote_average', 0)
-                        if rating:
-                            rating_label = tk.Label(
-                                details_frame,
-                                text=f"⭐ {rating}/10",
-                                font=("Helvetica", 10),
-                                bg=BG_COLOR,
-                                fg=ACCENT_COLOR
-                            )
-                            rating_label.pack(side=tk.LEFT)
-                        
-                        # Button row
-                        button_frame = tk.Frame(rec_item, bg=BG_COLOR, pady=5)
-                        button_frame.pack(fill=tk.X)
-                        
-                        view_button = HoverButton(
-                            button_frame,
-                            text="View",
-                            **BUTTON_STYLE,
-                            command=lambda m=rec: self._handle_view(m)
-                        )
-                        view_button.pack(side=tk.LEFT, padx=(0, 5))
-                else:
-                    no_rec_label = tk.Label(
-                        rec_frame,
-                        text="Add more movies to your watchlist to get recommendations",
+                # Details row
+                details_frame = tk.Frame(rec_item, bg=BG_COLOR)
+                details_frame.pack(fill=tk.X, pady=2)
+                
+                # Year if available
+                year = rec.get('release_year', '')
+                
+                if year:
+                    year_label = tk.Label(
+                        details_frame,
+                        text=f"{year}",
                         font=("Helvetica", 10),
                         bg=BG_COLOR,
-                        fg=TEXT_COLOR_LIGHT,
-                        wraplength=250,
-                        justify=tk.LEFT
+                        fg=TEXT_COLOR_LIGHT
                     )
-                    no_rec_label.pack()
-            except:
-                error_label = tk.Label(
-                    rec_frame,
-                    text="Unable to generate recommendations at this time",
-                    font=("Helvetica", 10),
-                    bg=BG_COLOR,
-                    fg=TEXT_COLOR_LIGHT,
-                    wraplength=250
+                    year_label.pack(side=tk.LEFT, padx=(0, 10))
+                
+                # Rating if available
+                rating = rec.get('vote_average', 0)
+                if rating:
+                    rating_label = tk.Label(
+                        details_frame,
+                        text=f"⭐ {rating}/10",
+                        font=("Helvetica", 10),
+                        bg=BG_COLOR,
+                        fg=ACCENT_COLOR
+                    )
+                    rating_label.pack(side=tk.LEFT)
+                
+                # Button row
+                button_frame = tk.Frame(rec_item, bg=BG_COLOR, pady=5)
+                button_frame.pack(fill=tk.X)
+                
+                view_button = HoverButton(
+                    button_frame,
+                    text="View",
+                    **BUTTON_STYLE,
+                    command=lambda m=rec: self._handle_view(m)
                 )
-                error_label.pack()
+                view_button.pack(side=tk.LEFT, padx=(0, 5))
+        else:
+            no_rec_label = tk.Label(
+                body,
+                text="Add more movies to your watchlist to get recommendations",
+                font=("Helvetica", 10),
+                bg=BG_COLOR,
+                fg=TEXT_COLOR_LIGHT,
+                wraplength=250,
+                justify=tk.LEFT
+            )
+            no_rec_label.pack()
+    
+    def _get_watchlist(self):
+        """Return the current user's watchlist, fetching it only when not cached"""
+        if self._watchlist_cache is None:
+            self._watchlist_cache = self.user_manager.get_watchlist()
+        return self._watchlist_cache
     
     def _resort_watchlist(self):
         """Resort the watchlist based on the selected criteria"""
-        watchlist = self.user_manager.get_watchlist()
-        self._populate_watchlist(watchlist)
+        self._populate_watchlist(self._get_watchlist())
     
     def _handle_view(self, movie):
         """Handle view button press"""
@@ -1532,6 +1647,7 @@ class WatchlistScreen(BaseScreen):
                 # Confirm removal
                 if show_confirmation("Remove Movie", f"Are you sure you want to remove '{movie.get('title', 'this movie')}' from your watchlist?"):
                     self.on_remove(movie_id)
+                    self._watchlist_cache = None
                     self.update_screen()
     
     def _handle_watched(self, movie):
@@ -1540,12 +1656,142 @@ class WatchlistScreen(BaseScreen):
         movie_title = movie.get('title', 'this movie')
         show_info("Watched", f"You've marked '{movie_title}' as watched! This feature will be available soon.")
     
+    def _refresh_count_badge(self, count):
+        """Update the count badge next to the watchlist header"""
+        self._count_badge.config(text=str(count))
+    
+    def _refresh_watchlist(self, watchlist):
+        """Update the already-built list, badge and sidebar in place"""
+        self._refresh_count_badge(len(watchlist))
+        self._populate_watchlist(watchlist)
+        self._refresh_stats(watchlist)
+        if self.recommender:
+            self._refresh_recommendations(watchlist)
+        self.set_status(f"Watchlist: {len(watchlist)} movies")
+    
     def update_screen(self):
         """Update the screen content"""
         super().update_screen()
-        # Recreate UI to reflect any changes
+        # Refetch the watchlist to reflect any changes
+        self._watchlist_cache = None
+        
+        # A populated list for the same user only needs its dirty regions updated
+        user = self.user_manager.get_current_user()
+        if user and self._built_for == user.get('id'):
+            watchlist = self._get_watchlist()
+            if watchlist:
+                self._refresh_watchlist(watchlist)
+                # The wheel is bound globally, so reclaim it from the last screen built
+                self.scroll_frame.bind_mousewheel()
+                return
+        
+        # Otherwise recreate UI (login prompt, empty state or a different user)
         self._create_ui()
 
+class _BookmarkCard:
+    """A recyclable bookmark card whose labels are rebound to a new movie in place"""
+    
+    def __init__(self, parent, screen, slot):
+        self.slot = slot
+        self.has_date = False
+        
+        # Create a card-style frame for the bookmark
+        self.frame = tk.Frame(
+            parent,
+            bg=BG_COLOR,
+            padx=PADDING_MEDIUM,
+            pady=PADDING_MEDIUM,
+            bd=1,
+            relief=tk.SOLID
+        )
+        
+        # Movie title with favorite star icon
+        title_frame = tk.Frame(self.frame, bg=BG_COLOR)
+        title_frame.pack(fill=tk.X, anchor='w', pady=(0, 10))
+        
+        star_label = tk.Label(
+            title_frame,
+            text="⭐",
+            font=("Helvetica", 14),
+            bg=BG_COLOR,
+            fg=ACCENT_COLOR
+        )
+        star_label.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.title_label = tk.Label(
+            title_frame,
+            **LABEL_TITLE,
+            anchor='w'
+        )
+        self.title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Year and rating share one label
+        self.details_label = tk.Label(
+            self.frame,
+            **LABEL_MUTED,
+            pady=5,
+            anchor='w'
+        )
+        self.details_label.pack(fill=tk.X)
+        
+        # Added date in a separate row, packed only for movies that have one
+        self.date_label = tk.Label(
+            self.frame,
+            font=("Helvetica", 9, "italic"),
+            bg=BG_COLOR,
+            fg=TEXT_COLOR_LIGHT,
+            anchor='w'
+        )
+        
+        # Buttons frame
+        self.button_frame = tk.Frame(self.frame, bg=BG_COLOR, pady=10)
+        self.button_frame.pack(fill=tk.X)
+        
+        # Buttons dispatch through the screen to whichever movie occupies this slot
+        dispatch = screen._dispatch_card
+        view_button = HoverButton(
+            self.button_frame,
+            text="View",
+            **BUTTON_STYLE,
+            command=functools.partial(dispatch, screen._handle_view, slot)
+        )
+        view_button.pack(side=tk.LEFT, padx=(0, 5))
+        
+        remove_button = HoverButton(
+            self.button_frame,
+            text="Remove",
+            **ACCENT_BUTTON_STYLE,
+            command=functools.partial(dispatch, screen._handle_remove, slot)
+        )
+        remove_button.pack(side=tk.LEFT)
+    
+    def bind(self, movie):
+        """Point the card at a movie and update its widgets in place"""
+        get = movie.get
+        self.title_label.config(text=truncate_text(get('title', 'Unknown Title'), 30))
+        
+        # Only show the details the movie actually has
+        details = []
+        year = get('release_year', '')
+        if year:
+            details.append(f"📅 {year}")
+        
+        rating = get('vote_average', None)
+        if rating is not None:
+            details.append(f"⭐ {rating}/10")
+        
+        self.details_label.config(text=_DETAILS_SEPARATOR.join(details))
+        
+        added_date = get('added_at', '')
+        if added_date:
+            self.date_label.config(text=_added_date_text(added_date))
+            if not self.has_date:
+                self.date_label.pack(fill=tk.X, pady=5, before=self.button_frame)
+                self.has_date = True
+        elif self.has_date:
+            self.date_label.pack_forget()
+            self.has_date = False
+
 class BookmarkScreen(BaseScreen):
     """Screen for displaying and managing user's bookmarks"""
     
@@ -1561,20 +1807,47 @@ class BookmarkScreen(BaseScreen):
         # Set screen title
         self.set_title("My Bookmarks")
         
-        # Initialize the UI
-        self._create_ui()
+        # Similar movies per bookmark id, kept until clear_recommender_cache()
+        self._similar_cached = functools.lru_cache(maxsize=256)(self._fetch_similar)
+        
+        # Bookmarks fetched per (user, bookmarks version), sorted once per sort option
+        self._bookmarks_cache = None
+        self._bookmarks_key = None
+        self._sorted_source = None
+        self._sorted_cache = {}
+        
+        # Windowed card state for the bookmarks grid
+        self._sorted_bookmarks = []
+        self._card_widgets = {}
+        self._card_cache = OrderedDict()
+        self._card_movies = []
+        self._pool_container = None
+        self._window = (0, 0)
+        self._card_row_height = None
+        self._refresh_pending = None
+        self._update_pending = None
+        self._last_render_key = None
+        
+        # Optional list view for large collections
+        self._list_view = tk.BooleanVar(self, value=False)
+        self._bookmarks_tree = None
+        self._tree_movies = {}
+        
+        # (user id, list view offered) of a populated grid that can be refreshed in place
+        self._built_for = None
+        self._sidebar = None
     
     def _create_ui(self):
         """Create the bookmarks screen UI"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Start from a fresh root frame
+        root_frame = self._reset_root_frame()
+        self._built_for = None
         
         # Get current user
         user = self.user_manager.get_current_user()
         if not user:
             # Show a more attractive message if not logged in
-            login_frame = tk.Frame(self.content_frame, bg=BG_COLOR, padx=50, pady=50)
+            login_frame = tk.Frame(root_frame, bg=BG_COLOR, padx=50, pady=50)
             login_frame.pack(expand=True)
             
             not_logged_label = tk.Label(
@@ -1617,7 +1890,7 @@ class BookmarkScreen(BaseScreen):
             return
         
         # Create a main frame with two columns
-        main_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
+        main_frame = tk.Frame(root_frame, bg=BG_COLOR)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Left column for bookmarks (2/3 width)
@@ -1628,75 +1901,39 @@ class BookmarkScreen(BaseScreen):
         right_column = tk.Frame(main_frame, bg=BG_COLOR, width=300)
         right_column.pack(side=tk.LEFT, fill=tk.Y, padx=(0, PADDING_MEDIUM), pady=PADDING_MEDIUM)
         right_column.pack_propagate(False)
+        self._sidebar = right_column
         
         # Create scrollable frame for bookmarks
         self.scroll_frame = ScrollableFrame(left_column, bg=BG_COLOR)
         self.scroll_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Bookmarks header with count badge
-        header_frame = tk.Frame(self.scroll_frame.scrollable_frame, bg=BG_COLOR)
-        header_frame.pack(fill=tk.X, anchor='w', pady=(0, PADDING_MEDIUM))
+        # Re-window the cards whenever the view scrolls or resizes
+        self.scroll_frame.canvas.configure(yscrollcommand=self._on_bookmarks_scroll)
         
-        header_label = tk.Label(
-            header_frame,
-            text="My Bookmarks",
-            font=("Helvetica", 20, "bold"),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-            anchor='w'
-        )
-        header_label.pack(side=tk.LEFT)
+        # Get bookmarks, preparing sort keys and sidebar stats in a single pass
+        bookmarks = self._get_bookmarks()
+        stats = _scan_bookmarks(bookmarks)
         
-        # Get bookmarks
-        bookmarks = self.user_manager.get_bookmarks()
-        
-        # Add count badge
-        count_badge = tk.Label(
-            header_frame,
-            text=str(len(bookmarks)),
-            font=("Helvetica", 12, "bold"),
-            bg=ACCENT_COLOR,  # Different color than watchlist
-            fg=TEXT_COLOR_INVERSE,
-            padx=10,
-            pady=2,
-            borderwidth=0
+        # Bookmarks header with count badge and sort options
+        header_frame, self._count_badge = self._build_sortable_list_header(
+            self.scroll_frame.scrollable_frame, "My Bookmarks", bookmarks, ACCENT_COLOR, self._resort_bookmarks
         )
-        count_badge.pack(side=tk.LEFT, padx=10)
-        
-        # Add sorting options
-        sort_frame = tk.Frame(header_frame, bg=BG_COLOR)
-        sort_frame.pack(side=tk.RIGHT)
+        header_frame.pack(fill=tk.X, anchor='w', pady=(0, PADDING_MEDIUM))
         
-        sort_label = tk.Label(
-            sort_frame,
-            text="Sort by:",
-            font=("Helvetica", 10),
-            bg=BG_COLOR,
-            fg=TEXT_COLOR_LIGHT
-        )
-        sort_label.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Sort buttons
-        self.sort_options = ["Date Added", "Title", "Rating"]
-        self.active_sort = tk.StringVar(value=self.sort_options[0])
-        
-        for option in self.sort_options:
-            sort_button = tk.Radiobutton(
-                sort_frame,
-                text=option,
-                variable=self.active_sort,
-                value=option,
+        # Large collections can be switched to a lighter list view
+        if len(bookmarks) > _LIST_VIEW_THRESHOLD:
+            list_toggle = tk.Checkbutton(
+                header_frame,
+                text="List view",
+                variable=self._list_view,
                 font=("Helvetica", 10),
                 bg=BG_COLOR,
                 fg=TEXT_COLOR,
+                activebackground=BG_COLOR,
                 selectcolor=BG_COLOR,
-                command=self._resort_bookmarks,
-                indicatoron=False,
-                bd=0,
-                padx=8,
-                pady=2
+                command=self._resort_bookmarks
             )
-            sort_button.pack(side=tk.LEFT, padx=2)
+            list_toggle.pack(side=tk.RIGHT, padx=PADDING_SMALL)
         
         # Bookmarks container
         self.bookmarks_container = tk.Frame(
@@ -1704,8 +1941,11 @@ class BookmarkScreen(BaseScreen):
             bg=BG_COLOR
         )
         self.bookmarks_container.pack(fill=tk.BOTH, expand=True)
+        self._bookmarks_tree = None
         
         if not bookmarks:
+            self._sorted_bookmarks = []
+            
             # Show an empty state with suggestions
             empty_frame = tk.Frame(self.bookmarks_container, bg=BG_COLOR, pady=30)
             empty_frame.pack(fill=tk.X)
@@ -1784,153 +2024,234 @@ class BookmarkScreen(BaseScreen):
                 view_button.pack(pady=5)
         else:
             # Sort the bookmarks based on current criteria
-            self._populate_bookmarks(bookmarks)
+            self._show_bookmarks(bookmarks)
         
         # Now populate the right sidebar
-        self._create_sidebar(right_column, bookmarks)
+        self._create_sidebar(right_column, bookmarks, stats)
+        
+        # Later updates for this user can refresh the populated grid in place
+        if bookmarks:
+            self._built_for = (user.get('id'), len(bookmarks) > _LIST_VIEW_THRESHOLD)
         
         # Set status
         self.set_status(f"Bookmarks: {len(bookmarks)} movies")
     
+    def _refresh_bookmarks(self, bookmarks):
+        """Update the already-built grid, badge and sidebar in place, keeping cached cards"""
+        self._count_badge.config(text=str(len(bookmarks)))
+        stats = _scan_bookmarks(bookmarks)
+        self._show_bookmarks(bookmarks)
+        
+        destroy_children(self._sidebar)
+        self._create_sidebar(self._sidebar, bookmarks, stats)
+        
+        self.set_status(f"Bookmarks: {len(bookmarks)} movies")
+    
+    def _show_bookmarks(self, bookmarks):
+        """Show bookmarks as cards, or as one Treeview when list view suits the collection"""
+        if self._list_view.get() and len(bookmarks) > _LIST_VIEW_THRESHOLD:
+            if self._bookmarks_tree is None:
+                self.bookmarks_container.pack_forget()
+                self._bookmarks_tree = self._create_bookmarks_tree(self.scroll_frame.scrollable_frame)
+            self._populate_tree(bookmarks)
+        else:
+            if self._bookmarks_tree is not None:
+                self._bookmarks_tree.master.destroy()
+                self._bookmarks_tree = None
+                self._tree_movies = {}
+            self._populate_bookmarks(bookmarks)
+    
+    def _sort_bookmarks(self, bookmarks):
+        """Return bookmarks in the selected sort order, sorting once per option"""
+        # Sorted orders are only valid for the bookmarks they were computed from
+        if self._sorted_source is not bookmarks:
+            self._sorted_source = bookmarks
+            self._sorted_cache = {}
+        
+        # Sort bookmarks based on selected option, once per option
+        sort_option = self.active_sort.get()
+        sorted_bookmarks = self._sorted_cache.get(sort_option)
+        if sorted_bookmarks is None:
+            sort_key = _BOOKMARK_SORT_KEYS.get(sort_option)
+            if sort_key:
+                _ensure_sort_keys(bookmarks)
+                key, reverse = sort_key
+                sorted_bookmarks = sorted(bookmarks, key=itemgetter(key), reverse=reverse)
+            else:
+                sorted_bookmarks = bookmarks
+            self._sorted_cache[sort_option] = sorted_bookmarks
+        self._sorted_bookmarks = sorted_bookmarks
+        return sorted_bookmarks
+    
+    def _create_bookmarks_tree(self, parent):
+        """Create the Treeview used by the list view, with its own scrollbar"""
+        tree_frame = tk.Frame(parent, bg=BG_COLOR)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tree = ttk.Treeview(tree_frame, columns=("year", "rating", "added"), height=_LIST_VIEW_ROWS)
+        tree.heading("#0", text="Title", anchor='w')
+        tree.heading("year", text="Year")
+        tree.heading("rating", text="Rating")
+        tree.heading("added", text="Added")
+        tree.column("#0", width=260)
+        tree.column("year", width=60, anchor=tk.CENTER, stretch=False)
+        tree.column("rating", width=80, anchor=tk.CENTER, stretch=False)
+        tree.column("added", width=140, stretch=False)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Open on double-click or Enter, remove with Delete
+        tree.bind("<Double-1>", lambda event: self._on_tree_item(self._handle_view))
+        tree.bind("<Return>", lambda event: self._on_tree_item(self._handle_view))
+        tree.bind("<Delete>", lambda event: self._on_tree_item(self._handle_remove))
+        return tree
+    
+    def _populate_tree(self, bookmarks):
+        """Fill the list view with one row per bookmark"""
+        tree = self._bookmarks_tree
+        tree.delete(*tree.get_children())
+        
+        tree_movies = self._tree_movies = {}
+        insert = tree.insert
+        for movie in self._sort_bookmarks(bookmarks):
+            get = movie.get
+            rating = get('vote_average', None)
+            added_date = get('added_at', '')
+            item = insert("", tk.END, text=get('title', 'Unknown Title'), values=(
+                get('release_year', ''),
+                "" if rating is None else f"⭐ {rating}/10",
+                _format_added_date(added_date) if added_date else ""
+            ))
+            tree_movies[item] = movie
+    
+    def _on_tree_item(self, handler):
+        """Run a handler on the movie in the focused list view row"""
+        movie = self._tree_movies.get(self._bookmarks_tree.focus())
+        if movie:
+            handler(movie)
+    
     def _populate_bookmarks(self, bookmarks):
         """Populate the bookmarks with movie items"""
-        # Clear existing items
-        for widget in self.bookmarks_container.winfo_children():
-            widget.destroy()
-            
-        # Sort bookmarks based on selected option
-        sort_option = self.active_sort.get()
-        if sort_option == "Date Added":
-            sorted_bookmarks = sorted(bookmarks, key=lambda m: m.get('added_at', ''), reverse=True)
-        elif sort_option == "Title":
-            sorted_bookmarks = sorted(bookmarks, key=lambda m: m.get('title', '').lower())
-        elif sort_option == "Rating":
-            sorted_bookmarks = sorted(bookmarks, key=lambda m: float(m.get('vote_average', 0)), reverse=True)
+        container = self.bookmarks_container
+        
+        # Detach the container so the rebuilt cards get laid out in one pass
+        container.pack_forget()
+        
+        if self._pool_container is not container:
+            # A fresh container needs its own spacers and card cache
+            self._pool_container = container
+            self._card_cache = OrderedDict()
+            self._card_movies = []
+            self._top_spacer = tk.Frame(container, bg=BG_COLOR, height=0)
+            self._top_spacer.grid(row=0, column=0, columnspan=2, sticky="ew")
+            self._bottom_spacer = tk.Frame(container, bg=BG_COLOR, height=0)
+            self._card_row_height = None
+            
+            # Equal-width columns so a new card never re-measures its neighbours
+            container.grid_columnconfigure((0, 1), weight=1, uniform="card")
         else:
-            sorted_bookmarks = bookmarks
-            
-        # Use a grid layout for bookmarks for a different look from watchlist
-        for i, movie in enumerate(sorted_bookmarks):
-            # Create a card-style frame for each bookmark
-            card_frame = tk.Frame(
-                self.bookmarks_container,
-                bg=BG_COLOR,
-                padx=PADDING_MEDIUM,
-                pady=PADDING_MEDIUM,
-                bd=1,
-                relief=tk.SOLID
-            )
-            
-            # Arrange in a 2-column grid
-            row = i // 2
-            col = i % 2
-            card_frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            
-            # Configure grid to expand correctly
-            self.bookmarks_container.grid_columnconfigure(0, weight=1)
-            self.bookmarks_container.grid_columnconfigure(1, weight=1)
-            
-            # Movie title with favorite star icon
-            title_frame = tk.Frame(card_frame, bg=BG_COLOR)
-            title_frame.pack(fill=tk.X, anchor='w', pady=(0, 10))
-            
-            star_label = tk.Label(
-                title_frame,
-                text="⭐",
-                font=("Helvetica", 14),
-                bg=BG_COLOR,
-                fg=ACCENT_COLOR
-            )
-            star_label.pack(side=tk.LEFT, padx=(0, 5))
-            
-            title_label = tk.Label(
-                title_frame,
-                text=truncate_text(movie.get('title', 'Unknown Title'), 30),
-                font=("Helvetica", 12, "bold"),
-                bg=BG_COLOR,
-                fg=TEXT_COLOR,
-                anchor='w'
-            )
-            title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            # Details frame for year and rating
-            details_frame = tk.Frame(card_frame, bg=BG_COLOR, pady=5)
-            details_frame.pack(fill=tk.X)
-            
-            # Year if available
-            year = movie.get('release_year', '')
-            if year:
-                year_label = tk.Label(
-                    details_frame,
-                    text=f"📅 {year}",
-                    font=("Helvetica", 10),
-                    bg=BG_COLOR,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                year_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            # Rating if available
-            rating = movie.get('vote_average', None)
-            if rating is not None:
-                rating_label = tk.Label(
-                    details_frame,
-                    text=f"⭐ {rating}/10",
-                    font=("Helvetica", 10),
-                    bg=BG_COLOR,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                rating_label.pack(side=tk.LEFT)
-            
-            # Added date in a separate row
-            added_date = movie.get('added_at', '')
-            if added_date:
-                try:
-                    # Format the date nicely
-                    date_obj = datetime.fromisoformat(added_date)
-                    date_text = f"Added: {date_obj.strftime('%B %d, %Y')}"
-                except:
-                    # Just take the date part as fallback
-                    try:
-                        date_part = added_date.split('T')[0]
-                        date_text = f"Added: {date_part}"
-                    except:
-                        date_text = f"Added: {added_date}"
-                
-                date_frame = tk.Frame(card_frame, bg=BG_COLOR)
-                date_frame.pack(fill=tk.X, pady=5)
-                
-                date_label = tk.Label(
-                    date_frame,
-                    text=date_text,
-                    font=("Helvetica", 9, "italic"),
-                    bg=BG_COLOR,
-                    fg=TEXT_COLOR_LIGHT
-                )
-                date_label.pack(anchor='w')
-            
-            # Buttons frame
-            button_frame = tk.Frame(card_frame, bg=BG_COLOR, pady=10)
-            button_frame.pack(fill=tk.X)
-            
-            # View button
-            view_button = HoverButton(
-                button_frame,
-                text="View",
-                **BUTTON_STYLE,
-                command=lambda m=movie: self._handle_view(m)
-            )
-            view_button.pack(side=tk.LEFT, padx=(0, 5))
-            
-            # Remove button
-            remove_button = HoverButton(
-                button_frame,
-                text="Remove",
-                **ACCENT_BUTTON_STYLE,
-                command=lambda m=movie: self._handle_remove(m)
-            )
-            remove_button.pack(side=tk.LEFT)
+            # Park the visible cards in the cache rather than destroying them
+            for card in self._card_widgets.values():
+                self._release_card(card)
+        self._card_widgets = {}
+        self._window = (0, 0)
+            
+        sorted_bookmarks = self._sort_bookmarks(bookmarks)
+        
+        # The bottom spacer sits just below the last grid row of cards
+        self._bottom_spacer.grid(row=(len(sorted_bookmarks) + 1) // 2 + 1, column=0, columnspan=2, sticky="ew")
+        
+        if sorted_bookmarks:
+            if self._card_row_height is None:
+                # Measure one rendered card to size the spacers
+                card = self._acquire_card(0)
+                card.frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+                self._card_widgets[0] = card
+                container.update_idletasks()
+                self._card_row_height = max(card.frame.winfo_reqheight() + 10, 1)
+            
+            self._refresh_visible_cards()
+        else:
+            self._top_spacer.config(height=0)
+            self._bottom_spacer.config(height=0)
+        
+        # Reattach and lay everything out once
+        container.pack(fill=tk.BOTH, expand=True)
+        self.scroll_frame.scrollable_frame.update_idletasks()
+    
+    def _acquire_card(self, index):
+        """Get a card for a sorted index, preferring one still bound to that movie"""
+        movie = self._sorted_bookmarks[index]
+        card = self._card_cache.pop(movie.get('id'), None)
+        if card is None:
+            if len(self._card_cache) >= _CARD_CACHE_SIZE:
+                # Recycle the least recently shown card
+                _, card = self._card_cache.popitem(last=False)
+            else:
+                card = _BookmarkCard(self.bookmarks_container, self, len(self._card_movies))
+                self._card_movies.append(None)
+        
+        # A cache hit for unchanged data needs no rebinding
+        if self._card_movies[card.slot] != movie:
+            self._card_movies[card.slot] = movie
+            card.bind(movie)
+        return card
     
-    def _create_sidebar(self, container, bookmarks):
+    def _release_card(self, card):
+        """Hide a card and keep it in the LRU cache, still bound to its movie"""
+        card.frame.grid_forget()
+        movie_id = self._card_movies[card.slot].get('id')
+        if movie_id is None or movie_id in self._card_cache:
+            movie_id = ('slot', card.slot)
+        self._card_cache[movie_id] = card
+    
+    def _dispatch_card(self, handler, slot):
+        """Run a card button handler on the movie currently bound to that card"""
+        handler(self._card_movies[slot])
+    
+    def _on_bookmarks_scroll(self, first, last):
+        """Keep the scrollbar in sync and re-window the cards after the view moves"""
+        self.scroll_frame.scrollbar.set(first, last)
+        if self._refresh_pending is None:
+            self._refresh_pending = self.after_idle(self._refresh_visible_cards)
+    
+    def _refresh_visible_cards(self):
+        """Render only the card rows that intersect the viewport, plus an overscan"""
+        self._refresh_pending = None
+        items = self._sorted_bookmarks
+        container = self.bookmarks_container
+        if not items or self._bookmarks_tree is not None or not container.winfo_exists():
+            return
+        
+        # Cards sit two to a grid row
+        row_height = self._card_row_height
+        n_rows = (len(items) + 1) // 2
+        start_row, end_row = _visible_span(self.scroll_frame, container, row_height, n_rows, _BOOKMARKS_OVERSCAN)
+        start, end = start_row * 2, min(end_row * 2, len(items))
+        
+        # Recycle cards that left the window
+        cards = self._card_widgets
+        for index in [i for i in cards if i < start or i >= end]:
+            self._release_card(cards.pop(index))
+        
+        # Bind cards that entered the window
+        for index in range(start, end):
+            if index not in cards:
+                card = self._acquire_card(index)
+                card.frame.grid(row=index // 2 + 1, column=index % 2, padx=5, pady=5, sticky="nsew")
+                cards[index] = card
+        
+        # Spacers preserve the full scroll extent
+        window = (start_row, end_row)
+        if window != self._window:
+            self._window = window
+            self._top_spacer.config(height=start_row * row_height)
+            self._bottom_spacer.config(height=(n_rows - end_row) * row_height)
+    
+    def _create_sidebar(self, container, bookmarks, stats):
         """Create the sidebar with stats and similar recommendations"""
         # Stats section
         stats_frame = tk.Frame(container, bg=BG_COLOR, bd=1, relief=tk.SOLID, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
@@ -1945,40 +2266,12 @@ class BookmarkScreen(BaseScreen):
         )
         stats_title.pack(anchor='w', pady=(0, PADDING_MEDIUM))
         
-        # Calculate stats - similar to watchlist but with some differences
-        genres_count = {}
-        years_count = {}
-        total_rating = 0
-        rating_count = 0
-        
-        for movie in bookmarks:
-            # Genres
-            movie_genres = movie.get('genres', [])
-            if movie_genres:
-                if isinstance(movie_genres, str):
-                    movie_genres = [g.strip() for g in movie_genres.split(',')]
-                for genre in movie_genres:
-                    if genre:
-                        genres_count[genre] = genres_count.get(genre, 0) + 1
-            
-            # Years
-            year = movie.get('release_year', '')
-            if year:
-                years_count[year] = years_count.get(year, 0) + 1
-            
-            # Ratings
-            rating = movie.get('vote_average', None)
-            if rating is not None:
-                try:
-                    rating_value = float(rating)
-                    total_rating += rating_value
-                    rating_count += 1
-                except:
-                    pass
+        # Stats were gathered alongside the sort keys
+        genres_count, ratings = stats
         
         # Display favorite genres
         if genres_count:
-            top_genres = sorted(genres_count.items(), key=lambda x: x[1], reverse=True)[:3]
+            top_genres = genres_count.most_common(3)
             
             genres_label = tk.Label(
                 stats_frame,
@@ -2015,8 +2308,8 @@ class BookmarkScreen(BaseScreen):
                 genre_count.pack(side=tk.RIGHT)
         
         # Display average rating
-        if rating_count > 0:
-            avg_rating = total_rating / rating_count
+        if ratings:
+            avg_rating = fmean(ratings)
             
             rating_frame = tk.Frame(stats_frame, bg=BG_COLOR, pady=5)
             rating_frame.pack(fill=tk.X)
@@ -2055,15 +2348,12 @@ class BookmarkScreen(BaseScreen):
             
             # Pick a random movie from bookmarks to get similar movies
             if bookmarks:
-                import random
                 random_movie = random.choice(bookmarks)
                 movie_id = random_movie.get('id')
                 
                 if movie_id:
                     try:
-                        similar_movies = self.recommender.get_similar_movies(
-                            movie_id, limit=3
-                        )
+                        similar_movies = self._similar_cached(movie_id)
                         
                         if similar_movies:
                             for movie in similar_movies:
@@ -2073,9 +2363,7 @@ class BookmarkScreen(BaseScreen):
                                 title_label = tk.Label(
                                     movie_item,
                                     text=truncate_text(movie.get('title', 'Unknown'), 25),
-                                    font=("Helvetica", 12, "bold"),
-                                    bg=BG_COLOR,
-                                    fg=TEXT_COLOR,
+                                    **LABEL_TITLE,
                                     anchor='w'
                                 )
                                 title_label.pack(anchor='w')
@@ -2086,18 +2374,12 @@ class BookmarkScreen(BaseScreen):
                                 
                                 # Year if available
                                 year = movie.get('release_year', '')
-                                if not year and 'release_date' in movie:
-                                    year_match = re.search(r'(\d{4})', str(movie['release_date']))
-                                    if year_match:
-                                        year = year_match.group(1)
                                 
                                 if year:
                                     year_label = tk.Label(
                                         details_frame,
                                         text=f"{year}",
-                                        font=("Helvetica", 10),
-                                        bg=BG_COLOR,
-                                        fg=TEXT_COLOR_LIGHT
+                                        **LABEL_MUTED
                                     )
                                     year_label.pack(side=tk.LEFT, padx=(0, 10))
                                 
@@ -2128,9 +2410,7 @@ class BookmarkScreen(BaseScreen):
                             no_rec_label = tk.Label(
                                 similar_frame,
                                 text="No similar movies found",
-                                font=("Helvetica", 10),
-                                bg=BG_COLOR,
-                                fg=TEXT_COLOR_LIGHT,
+                                **LABEL_MUTED,
                                 wraplength=250
                             )
                             no_rec_label.pack()
@@ -2138,17 +2418,36 @@ class BookmarkScreen(BaseScreen):
                         error_label = tk.Label(
                             similar_frame,
                             text=f"Unable to find similar movies",
-                            font=("Helvetica", 10),
-                            bg=BG_COLOR,
-                            fg=TEXT_COLOR_LIGHT,
+                            **LABEL_MUTED,
                             wraplength=250
                         )
                         error_label.pack()
     
+    def _fetch_similar(self, movie_id):
+        """Ask the recommender for movies similar to a bookmark"""
+        return self.recommender.get_similar_movies(movie_id, limit=3)
+    
+    def clear_recommender_cache(self):
+        """Forget cached similar movies, e.g. after the movie catalog changes"""
+        self._similar_cached.cache_clear()
+        self._last_render_key = None
+    
+    def _bookmarks_state(self):
+        """Identify the current user's bookmarks as of their last change"""
+        user = self.user_manager.get_current_user()
+        return (user and user.get('id'), self.user_manager.bookmarks_version)
+    
+    def _get_bookmarks(self):
+        """Return the current user's bookmarks, refetching only after they change"""
+        key = self._bookmarks_state()
+        if key != self._bookmarks_key:
+            self._bookmarks_key = key
+            self._bookmarks_cache = self.user_manager.get_bookmarks()
+        return self._bookmarks_cache
+    
     def _resort_bookmarks(self):
-        """Resort the bookmarks based on the selected criteria"""
-        bookmarks = self.user_manager.get_bookmarks()
-        self._populate_bookmarks(bookmarks)
+        """Redraw the bookmarks for the selected sort criteria and view"""
+        self._show_bookmarks(self._get_bookmarks())
     
     def _handle_view(self, movie):
         """Handle view button press"""
@@ -2166,7 +2465,41 @@ class BookmarkScreen(BaseScreen):
                     self.update_screen()
     
     def update_screen(self):
-        """Update the screen content"""
+        """Update the screen, coalescing changes that arrive in quick succession"""
         super().update_screen()
-        # Recreate UI to reflect any changes
-        self._create_ui()
+        
+        if self._update_pending is not None:
+            self.after_cancel(self._update_pending)
+            self._update_pending = None
+        
+        # Draw straight away when about to be shown (show_screen updates before packing),
+        # on a first build or for a different user; only coalesce repeats while visible
+        last_key = self._last_render_key
+        if (not self.winfo_ismapped() or last_key is None
+                or last_key[0] != self._bookmarks_state()[0]):
+            self._do_update()
+        else:
+            self._update_pending = self.after(_UPDATE_DEBOUNCE_MS, self._do_update)
+    
+    def _do_update(self):
+        """Rebuild the screen content if the bookmarks changed"""
+        self._update_pending = None
+        
+        # Nothing to redraw if the user and their bookmarks are unchanged
+        render_key = self._bookmarks_state()
+        if render_key == self._last_render_key:
+            # The wheel is bound globally, so reclaim it from the last screen built
+            scroll_frame = getattr(self, 'scroll_frame', None)
+            if scroll_frame is not None and scroll_frame.winfo_exists():
+                scroll_frame.bind_mousewheel()
+            return
+        
+        # A populated grid for the same user keeps its container and card cache
+        bookmarks = self._get_bookmarks()
+        if bookmarks and self._built_for == (render_key[0], len(bookmarks) > _LIST_VIEW_THRESHOLD):
+            self._refresh_bookmarks(bookmarks)
+            self.scroll_frame.bind_mousewheel()
+        else:
+            # Otherwise recreate UI (login prompt, empty state, different user or toggle)
+            self._create_ui()
+        self._last_render_key = render_key
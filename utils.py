@@ -5,24 +5,57 @@ import os
 import json
 import re
 import ast
+import functools
 from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox
 
+# orjson is optional; saving falls back to the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Year extraction helpers for convert_to_year
+_YEAR_RE = re.compile(r'(\d{4})')
+_DATE_FMTS = ("%Y-%m-%d", "%d-%m-%Y", "%Y")
+
 def create_directory_if_not_exists(directory_path):
-    """Create a directory if it doesn't exist"""
-    if not os.path.exists(directory_path):
-        os.makedirs(directory_path)
+    """Create a directory if it doesn't exist, returning whether it is now present"""
+    try:
+        os.makedirs(directory_path, exist_ok=True)
         return True
-    return False
+    except OSError:
+        return False
+
+def _json_default(obj):
+    """Convert numpy values, which neither serializer handles natively, to plain Python"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 def save_json_data(data, file_path):
-    """Save data to a JSON file"""
+    """Save data to a JSON file as UTF-8 with a 2-space indent"""
     directory = os.path.dirname(file_path)
     create_directory_if_not_exists(directory)
     
-    with open(file_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    # Both paths produce the same bytes: orjson only offers a 2-space indent and raw UTF-8
+    if orjson is not None:
+        payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, default=_json_default, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Write a temporary file and swap it in so a crash never leaves a truncated file
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Don't leave a partial temporary file behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 def load_json_data(file_path, default=None):
     """Load data from a JSON file"""
@@ -33,7 +66,7 @@ def load_json_data(file_path, default=None):
         return default
     
     try:
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', encoding='utf-8') as file:
             return json.load(file)
     except (json.JSONDecodeError, FileNotFoundError):
         return default
@@ -43,29 +76,48 @@ def convert_to_year(date_str):
     if not isinstance(date_str, str) or not date_str:
         return None
     
-    # Try different date formats
-    date_formats = ["%Y-%m-%d", "%d-%m-%Y", "%Y"]
+    # ISO dates (the common case) start with the year
+    if len(date_str) >= 4 and date_str[:4].isdecimal():
+        return int(date_str[:4])
     
-    for fmt in date_formats:
+    # Try different date formats
+    for fmt in _DATE_FMTS:
         try:
             return datetime.strptime(date_str, fmt).year
         except ValueError:
             continue
     
     # If all formats fail, try to extract year using regex
-    year_match = re.search(r'(\d{4})', date_str)
+    year_match = _YEAR_RE.search(date_str)
     if year_match:
         return int(year_match.group(1))
     
     return None
 
+def _loads_list_literal(list_str):
+    """Parse a JSON or Python list literal, trying the C JSON decoder before ast"""
+    try:
+        return json.loads(list_str)
+    except ValueError:
+        pass
+    
+    # Single-quoted Python lists are valid JSON once the quotes are swapped,
+    # as long as no double quotes or escapes could change their meaning
+    if '"' not in list_str and '\\' not in list_str:
+        try:
+            return json.loads(list_str.replace("'", '"'))
+        except ValueError:
+            pass
+    
+    return ast.literal_eval(list_str)
+
 def safe_eval_list(list_str):
     """Safely evaluate a string representation of a list"""
     if not isinstance(list_str, str):
         return []
     
     try:
-        result = ast.literal_eval(list_str)
+        result = _loads_list_literal(list_str)
         if isinstance(result, list):
             return result
         return []
@@ -117,6 +169,14 @@ def create_circular_frame(parent, size, bg_color="#ffffff", border_color=None, b
     
     return frame, canvas
 
+def destroy_children(widget):
+    """Destroy all child widgets of a widget"""
+    # Walk tkinter's own children mapping rather than winfo_children(), which
+    # queries Tcl and resolves every child name back to a Python widget
+    for child in list(widget.children.values()):
+        child.destroy()
+
+@functools.lru_cache(maxsize=4096)
 def truncate_text(text, max_length=30):
     """Truncate text to a maximum length"""
     if len(text) <= max_length:
@@ -145,9 +205,9 @@ def parse_list_string(list_string):
     # Clean the string
     list_string = list_string.strip()
     if list_string.startswith('[') and list_string.endswith(']'):
-        # Try using ast.literal_eval for safety
+        # Try JSON, then ast.literal_eval, for safety
         try:
-            return ast.literal_eval(list_string)
+            return _loads_list_literal(list_string)
         except (SyntaxError, ValueError):
             pass
     